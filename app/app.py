@@ -15,6 +15,10 @@ from kedro.framework.startup import bootstrap_project
 from kedro.io import DataCatalog
 from kedro.framework.project import find_pipelines
 
+from rohith_ai_839.drift import OnlineDriftMonitor
+from rohith_ai_839.pipelines.data_processing.nodes import preprocess_single_record
+from rohith_ai_839.pipelines.model_xplain.nodes import xplain_model_prediction
+
 import time
 
 from dotenv import load_dotenv
@@ -67,6 +71,30 @@ KEDRO_CONTEXT: KedroContext = KEDRO_SESSION.load_context()
 KEDRO_CATALOG: DataCatalog = KEDRO_CONTEXT.catalog
 pipelines = find_pipelines()
 
+# Cached for online preprocessing, reloaded whenever the pipelines are re-run
+PREPROCESSOR = KEDRO_CATALOG.load("preprocessor")
+FEATURES = KEDRO_CONTEXT.params["model_options"]["features"]
+
+
+def load_drift_monitors():
+    """Builds the online drift monitors of the surveys and of the predictions from the
+    sketches of the reference data saved by the training pipeline."""
+    drift_options = KEDRO_CONTEXT.params["drift_options"]
+    return (
+        OnlineDriftMonitor(
+            KEDRO_CATALOG.load("X_train_sketch"),
+            drift_share=drift_options["drift_share"],
+            **drift_options["online"],
+        ),
+        OnlineDriftMonitor(
+            KEDRO_CATALOG.load("y_test_sketch"), **drift_options["online"]
+        ),
+    )
+
+
+# Fed by /submit-survey and /run_pipeline, rebuilt whenever the pipelines are re-run
+FEATURE_DRIFT_MONITOR, PREDICTION_DRIFT_MONITOR = load_drift_monitors()
+
 
 @app.route("/login", methods=["POST"])
 @cross_origin()
@@ -170,6 +198,15 @@ def submit_survey():
 
     KEDRO_CATALOG.save(USER_DATA_CATALOG_NAME, user_df)
 
+    try:
+        x = preprocess_single_record(
+            user_df.loc[location].to_dict(), PREPROCESSOR, FEATURES
+        )
+        FEATURE_DRIFT_MONITOR.update(dict(zip(FEATURES, x)))
+    except ValueError:
+        # Surveys the model cannot score are not monitored either
+        pass
+
     print(data)
     return jsonify({"message": "data_received", "success": True}), 201
 
@@ -189,13 +226,17 @@ def right_to_erasure():
 
     os.chdir("..")
     #os.system("python .\utils\kill_port.py")
-    os.system("kedro run")
+    os.system("kedro run --runner=rohith_ai_839.runner.CachingThreadRunner")
+
+    global PREPROCESSOR, FEATURE_DRIFT_MONITOR, PREDICTION_DRIFT_MONITOR
+    PREPROCESSOR = KEDRO_CATALOG.load("preprocessor")
+    FEATURE_DRIFT_MONITOR, PREDICTION_DRIFT_MONITOR = load_drift_monitors()
 
     return jsonify({"message": "Removed your personal data from the model", "success": True}), 201
 
 @app.route("/update_predictions")
 def update_predictions():
-    df = pd.read_csv("../data/user_accounts_predictions_log.csv")
+    df = KEDRO_CATALOG.load("user_accounts_predictions_log")
     x_pred = df.drop(columns=["id", "Name", "City", "Depression"]).iloc[0].tolist()
     ml_flow_response = requests.post(
         mlflow_url,
@@ -208,6 +249,19 @@ def update_predictions():
     print(y_pred)
     
 
+@app.route("/drift")
+@cross_origin()
+def drift():
+    # Drift of the last surveys and predictions from the training data, see
+    # drift_options
+    return jsonify(
+        {
+            "features": FEATURE_DRIFT_MONITOR.report(),
+            "predictions": PREDICTION_DRIFT_MONITOR.report(),
+        }
+    )
+
+
 # function to send the message to ChatGPT
 def send_to_chatgpt(message):
     try:
@@ -241,19 +295,13 @@ def run_pipeline():
     userid = int(data['userid'])
     
     socketio.emit("data_processing_start", {"success":True})    
-    with KedroSession.create(project_path=KEDRO_PROJECT_PATH, env=KEDRO_ENV) as SESSION:
-    
-        SESSION.run(pipeline_name='data_processing', 
-                      node_names =["preprocess_user_predictions_log_node"], 
-                      from_inputs=["dataset", USER_DATA_CATALOG_NAME], 
-                      to_outputs=["user_accounts_predictions_log"])
-    time.sleep(2)
-    
-    user_df = KEDRO_CATALOG.load("user_accounts_predictions_log")
-    
-    x_pred = user_df.loc[user_df['id']==userid].drop(columns=["id", "Name", "City", "Depression"])
+    user_df = KEDRO_CATALOG.load(USER_DATA_CATALOG_NAME)
+    record = user_df.loc[user_df['id']==userid].iloc[0].to_dict()
     
-    x_pred = x_pred.values[0].tolist()
+    try:
+        x_pred = preprocess_single_record(record, PREPROCESSOR, FEATURES).tolist()
+    except ValueError as e:
+        return jsonify({"message": str(e), "success": False}), 400
     
     data = {
         "instances": [x_pred]
@@ -268,26 +316,29 @@ def run_pipeline():
     )
     
     prediction = ml_flow_response.json()['predictions'][0]
-    user_df = KEDRO_CATALOG.load("user_accounts_predictions_log")
-    user_df.loc[user_df['id']==userid]['Depression'] = int(prediction)
     
     prediction_mapped = 'Yes' if bool(prediction) else 'No'
+    PREDICTION_DRIFT_MONITOR.update({"Depression": int(prediction)})
     
     time.sleep(2)
     
     socketio.emit("interpretation_start", {"success":True})
     
-    print("This is fine")    
-    with KedroSession.create(project_path=KEDRO_PROJECT_PATH, env=KEDRO_ENV, extra_params={"userid": userid}) as SESSION:
-        print("This is also fine")    
-        
-        SESSION.run(pipeline_name='model_xplain', 
-                      node_names =["xplain_model_prediction"], 
-                      from_inputs=["sklearn_model", "user_accounts_predictions_log", "params:userid"], 
-                      to_outputs=["shap_instance_features_to_prediction", "shap_instance_features_away_prediction"])
-    
-    features_to_predicted_label = KEDRO_CATALOG.load("shap_instance_features_to_prediction")
-    features_away_predicted_label = KEDRO_CATALOG.load("shap_instance_features_away_prediction")
+    # The explanation runs on the in-process record, as the preprocessed log is not
+    # refreshed for online requests
+    x_pred_df = pd.DataFrame([x_pred], columns=FEATURES).assign(
+        id=userid, Name=username, City=record["City"], Depression=int(prediction)
+    )
+    (
+        features_to_predicted_label,
+        features_away_predicted_label,
+    ) = xplain_model_prediction(KEDRO_CATALOG.load("sklearn_model"), x_pred_df, userid)
+    KEDRO_CATALOG.save(
+        "shap_instance_features_to_prediction", features_to_predicted_label
+    )
+    KEDRO_CATALOG.save(
+        "shap_instance_features_away_prediction", features_away_predicted_label
+    )
     
     print("features_to_predicted_label: ", features_to_predicted_label)
     print("features_away_predicted_label: ", features_away_predicted_label)
@@ -0,0 +1,190 @@
+"""
+Benchmarks of the data_processing pipeline on synthetic survey data.
+
+Synthetic frames follow the `USERS_COLUMNS` schema of the survey app, with categorical
+values drawn from the frequencies observed in data/01_raw/depression_real.csv plus a
+tail of rare values, so that the category grouping does real work. For every size the
+wall time (best of --repeat runs) and the peak memory allocated by each node are
+reported. Run it from the project root:
+
+    python benchmarks/data_processing.py --rows 10000 100000
+    python benchmarks/data_processing.py --save baseline.json
+    python benchmarks/data_processing.py --compare baseline.json --tolerance 0.2
+
+With --compare the script exits with status 1 when a timing or peak memory exceeds the
+baseline by more than the tolerance.
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from rohith_ai_839.pipelines.data_processing.nodes import (
+    preprocess_dataset,
+    preprocess_user_predictions_log,
+)
+
+# Same schema as USERS_COLUMNS in app/app.py
+USERS_COLUMNS = [
+    "id",
+    "Name",
+    "Gender",
+    "Age",
+    "City",
+    "Working Professional or Student",
+    "Profession",
+    "Academic Pressure",
+    "Work Pressure",
+    "CGPA",
+    "Study Satisfaction",
+    "Job Satisfaction",
+    "Sleep Duration",
+    "Dietary Habits",
+    "Degree",
+    "Have you ever had suicidal thoughts ?",
+    "Work/Study Hours",
+    "Financial Stress",
+    "Family History of Mental Illness",
+    "Depression",
+]
+CATEGORICAL_COLUMNS = [
+    "Name",
+    "Gender",
+    "City",
+    "Profession",
+    "Sleep Duration",
+    "Dietary Habits",
+    "Degree",
+    "Have you ever had suicidal thoughts ?",
+    "Family History of Mental Illness",
+]
+DEFAULT_ROWS = [10_000, 100_000, 1_000_000, 10_000_000]
+REFERENCE_DATASET = "data/01_raw/depression_real.csv"
+
+
+def make_survey_frame(n_rows, seed=0, rare_fraction=0.02):
+    """
+    Generates a synthetic survey frame with the `USERS_COLUMNS` schema.
+
+    Args:
+        n_rows (int): Number of rows to generate.
+        seed (int): Seed of the random generator.
+        rare_fraction (float): Share of categorical values replaced by rare values that
+            do not appear in the reference dataset.
+
+    Returns:
+        pd.DataFrame: The synthetic survey answers, with a binary "Depression" target.
+    """
+    rng = np.random.default_rng(seed)
+    reference = pd.read_csv(REFERENCE_DATASET)
+
+    dataset = {"id": np.arange(n_rows)}
+    for col in CATEGORICAL_COLUMNS:
+        frequencies = reference[col].value_counts(normalize=True)
+        values = rng.choice(frequencies.index.to_numpy(), n_rows, p=frequencies.values)
+        rare = rng.random(n_rows) < rare_fraction
+        values[rare] = [f"{col} {i}" for i in rng.integers(0, 500, rare.sum())]
+        dataset[col] = values
+
+    students = rng.random(n_rows) < 0.2
+    dataset["Working Professional or Student"] = np.where(
+        students, "Student", "Working Professional"
+    )
+    dataset["Age"] = rng.integers(18, 61, n_rows)
+    dataset["Work/Study Hours"] = rng.integers(0, 13, n_rows)
+    dataset["Financial Stress"] = rng.integers(1, 6, n_rows)
+    # Academic answers are only given by students, work answers by professionals
+    for col in ["Academic Pressure", "Study Satisfaction"]:
+        dataset[col] = np.where(students, rng.integers(1, 6, n_rows), np.nan)
+    for col in ["Work Pressure", "Job Satisfaction"]:
+        dataset[col] = np.where(students, np.nan, rng.integers(1, 6, n_rows))
+    dataset["CGPA"] = np.where(students, rng.uniform(5, 10, n_rows).round(2), np.nan)
+    dataset["Depression"] = (rng.random(n_rows) < 0.18).astype(float)
+
+    return pd.DataFrame(dataset)[USERS_COLUMNS]
+
+
+def measure(func, *args, repeat=3):
+    """
+    Measures the best wall time and the peak allocated memory of a call.
+
+    Returns:
+        Tuple[float, float]: Wall time in seconds and peak memory in MiB.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+
+    # Measured separately, as tracing allocations slows the call down
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return min(timings), peak / 2**20
+
+
+def run(rows, repeat):
+    results = {}
+    for n_rows in rows:
+        dataset = make_survey_frame(n_rows)
+        _, preprocessor = preprocess_dataset(dataset)
+        survey_inputs_log = make_survey_frame(n_rows, seed=1)
+        survey_inputs_log["Depression"] = np.nan
+
+        benchmarks = {
+            "preprocess_dataset": (preprocess_dataset, dataset),
+            "preprocess_user_predictions_log": (
+                preprocess_user_predictions_log,
+                survey_inputs_log,
+                preprocessor,
+            ),
+        }
+        for name, (func, *args) in benchmarks.items():
+            wall_time, peak = measure(func, *args, repeat=repeat)
+            results[f"{name}[{n_rows}]"] = {"wall_time": wall_time, "peak_mib": peak}
+            print(f"{name:<34}{n_rows:>12,}{wall_time:>12.3f} s{peak:>12.1f} MiB")
+    return results
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        for metric, value in result.items():
+            if value > baseline[key][metric] * (1 + tolerance):
+                regressions.append(
+                    f"{key} {metric}: {value:.3f} vs {baseline[key][metric]:.3f}"
+                )
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file written by --save")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    print(f"{'benchmark':<34}{'rows':>12}{'wall time':>14}{'peak memory':>16}")
+    results = run(args.rows, args.repeat)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,121 @@
+"""
+Benchmarks of the drift checks of the data_science pipeline on synthetic survey data.
+
+Synthetic surveys from `benchmarks/data_processing.py` are preprocessed and split in
+halves: the first is the reference data (`X_train`, `y_test`), the second the current
+data (`X_test`, the predictions log). For every size the wall time (best of --repeat
+runs) of the reference sketches and of both drift nodes is reported. With --evidently,
+the Evidently report the drift nodes used to build is timed as well, split into the
+report itself and its `report.json()` / `json.loads` round trip, the serialization
+cost the nodes no longer pay. Run it from the project root:
+
+    python benchmarks/drift.py --rows 10000 100000
+    python benchmarks/drift.py --rows 10000 --evidently
+    python benchmarks/drift.py --save baseline.json
+    python benchmarks/drift.py --compare baseline.json --tolerance 0.2
+
+With --compare the script exits with status 1 when a timing exceeds the baseline by
+more than the tolerance.
+"""
+import argparse
+import json
+import sys
+import time
+
+from data_processing import compare, make_survey_frame
+
+from rohith_ai_839.pipelines.data_processing.nodes import preprocess_dataset
+from rohith_ai_839.pipelines.data_science.nodes import (
+    prediction_drift_check,
+    quality_drift_check,
+    sketch_reference_data,
+)
+
+DEFAULT_ROWS = [10_000, 100_000, 1_000_000]
+DRIFT_OPTIONS = {"drift_share": 0.5, "stattest_threshold": None}
+
+
+def best_time(func, *args, repeat=3):
+    """Returns the best wall time in seconds of a call and its last result."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def evidently_drift(reference, current):
+    """The drift check as the nodes made it before, with the Evidently report."""
+    from evidently.metric_preset import DataDriftPreset
+    from evidently.report import Report
+
+    report = Report(metrics=[DataDriftPreset()])
+    report.run(reference_data=reference, current_data=current)
+    return report
+
+
+def serialize(report):
+    return json.loads(report.json())
+
+
+def run(rows, repeat, evidently):
+    results = {}
+    for n_rows in rows:
+        dataset, _ = preprocess_dataset(make_survey_frame(n_rows))
+        dataset["Depression"] = dataset["Depression"].fillna(0)
+        X = dataset.drop(columns=["Name", "City", "Depression"])
+        y = dataset[["Depression"]]
+        half = len(dataset) // 2
+        X_train, X_test = X.iloc[:half], X.iloc[half:]
+        y_test, user_df = y.iloc[:half], y.iloc[half:]
+
+        wall_time, (X_train_sketch, y_test_sketch) = best_time(
+            sketch_reference_data, X_train, y_test, repeat=repeat
+        )
+        benchmarks = {"sketch_reference_data": wall_time}
+        benchmarks["quality_drift_check"], _ = best_time(
+            quality_drift_check, X_train_sketch, X_test, DRIFT_OPTIONS, repeat=repeat
+        )
+        benchmarks["prediction_drift_check"], _ = best_time(
+            prediction_drift_check, user_df, y_test_sketch, DRIFT_OPTIONS, repeat=repeat
+        )
+        if evidently:
+            benchmarks["evidently_report"], report = best_time(
+                evidently_drift, X_train, X_test, repeat=repeat
+            )
+            benchmarks["evidently_serialization"], _ = best_time(
+                serialize, report, repeat=repeat
+            )
+
+        for name, wall_time in benchmarks.items():
+            results[f"{name}[{n_rows}]"] = {"wall_time": wall_time}
+            print(f"{name:<34}{n_rows:>12,}{wall_time:>12.3f} s")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--evidently", action="store_true", help="Also time the Evidently report"
+    )
+    parser.add_argument("--save", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file written by --save")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    print(f"{'benchmark':<34}{'rows':>12}{'wall time':>14}")
+    results = run(args.rows, args.repeat, args.evidently)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        sys.exit(1 if regressions else 0)
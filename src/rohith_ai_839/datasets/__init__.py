@@ -6,12 +6,24 @@ import lazy_loader as lazy
 
 # https://github.com/pylint-dev/pylint/issues/4300#issuecomment-1043601901
 ARFFDataset: Any
+ChunkedCSVDataset: Any
 EvidentlyReportHTML: Any
+LazyDataset: Any
+NumpyDataset: Any
+ONNXModelDataset: Any
+OptionalParquetDataset: Any
+OptionalPickleDataset: Any
 
 __getattr__, __dir__, __all__ = lazy.attach(
     __name__,
     submod_attrs={
         "arff_dataset": ["ARFFDataset"],
+        "chunked_csv_dataset": ["ChunkedCSVDataset"],
         "evidently_report_html_dataset": ["EvidentlyReportHTML"],
+        "lazy_dataset": ["LazyDataset"],
+        "numpy_dataset": ["NumpyDataset"],
+        "onnx_model_dataset": ["ONNXModelDataset"],
+        "optional_parquet_dataset": ["OptionalParquetDataset"],
+        "optional_pickle_dataset": ["OptionalPickleDataset"],
     },
 )
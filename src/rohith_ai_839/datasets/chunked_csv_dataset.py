@@ -0,0 +1,161 @@
+from copy import deepcopy
+from pathlib import PurePath
+from typing import Any, Dict, Iterator, Optional
+
+import fsspec
+import pandas as pd
+from kedro.io import AbstractVersionedDataset, DatasetError
+from kedro.io.core import Version, get_filepath_str, get_protocol_and_path
+
+
+class CSVChunks:
+    """
+    A re-iterable view over a CSV file that is read lazily, chunk by chunk.
+
+    Every iteration re-opens the file, so the same object can be traversed several
+    times (e.g. once to accumulate statistics and once to transform the rows) while
+    holding at most one chunk in memory.
+
+    Attributes:
+    -----------
+        chunksize (Optional[int]): Number of rows per chunk. When None the whole file
+            is yielded as a single DataFrame.
+    """
+
+    def __init__(
+        self,
+        fs: fsspec.AbstractFileSystem,
+        load_path: str,
+        load_args: Dict[str, Any],
+        chunksize: Optional[int] = None,
+    ):
+        self._fs = fs
+        self._load_path = load_path
+        self._load_args = load_args
+        self.chunksize = chunksize
+
+    def with_chunksize(self, chunksize: Optional[int]) -> "CSVChunks":
+        """
+        Returns a view over the same file read with a different chunk size.
+
+        Parameters:
+        -----------
+            chunksize (Optional[int]): Number of rows per chunk, None for the whole
+                file.
+        """
+        return CSVChunks(self._fs, self._load_path, self._load_args, chunksize)
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        with self._fs.open(self._load_path, "r") as f:
+            if self.chunksize is None:
+                yield pd.read_csv(f, **self._load_args)
+            else:
+                yield from pd.read_csv(f, chunksize=self.chunksize, **self._load_args)
+
+
+class ChunkedCSVDataset(AbstractVersionedDataset):
+    """
+    A dataset class used to read CSV files larger than memory.
+
+    Loading does not read any rows: it returns a `CSVChunks` view that the nodes
+    iterate over, choosing the chunk size themselves.
+
+    Attributes:
+    -----------
+        _protocol (str): The protocol extracted from the file path (e.g., 'file', 's3').
+        _filepath (PurePath): The path to the CSV file, excluding the protocol.
+        _fs (fsspec.AbstractFileSystem): The file system handler based on the protocol.
+        _load_args (Dict[str, Any]): Extra arguments passed to `pd.read_csv`.
+
+    Methods:
+    --------
+        _load() -> CSVChunks:
+            Returns a lazy, re-iterable view over the CSV file.
+
+        _save():
+            Raises a DatasetError, the dataset is read-only.
+
+        _exists() -> bool:
+            Checks whether the CSV file exists.
+
+        _describe() -> Dict[str, Any]:
+            Provides a description of the dataset, including the file path, version,
+            and protocol used.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        load_args: Dict[str, Any] = None,
+        version: Version = None,
+    ):
+        """
+        Initializes the ChunkedCSVDataset with a specified file path and optional
+        versioning.
+
+        Parameters:
+        -----------
+            filepath (str): The path to the CSV file.
+            load_args (Dict[str, Any], optional): Extra arguments passed to
+                `pd.read_csv`. A "chunksize" entry sets the default chunk size of the
+                loaded view.
+            version (Version, optional): Version identifier for tracking different
+            versions of the dataset. Defaults to None.
+        """
+        protocol, path = get_protocol_and_path(filepath)
+        self._protocol = protocol
+        self._filepath = PurePath(path)
+        self._fs = fsspec.filesystem(self._protocol)
+        self._load_args = deepcopy(load_args) or {}
+
+        super().__init__(
+            filepath=PurePath(path),
+            version=version,
+            exists_function=self._fs.exists,
+            glob_function=self._fs.glob,
+        )
+
+    def _load(self) -> CSVChunks:
+        """
+        Returns a lazy view over the CSV file.
+
+        Returns:
+        --------
+            CSVChunks: A re-iterable object yielding the file as DataFrame chunks.
+        """
+        load_path = get_filepath_str(self._get_load_path(), self._protocol)
+        load_args = dict(self._load_args)
+        chunksize = load_args.pop("chunksize", None)
+
+        return CSVChunks(self._fs, load_path, load_args, chunksize)
+
+    def _save(self, data: Any) -> None:
+        # Raw survey dumps are only ever read by the pipelines
+        raise DatasetError(f"{self.__class__.__name__} is a read-only dataset")
+
+    def _exists(self) -> bool:
+        """
+        Checks whether the CSV file exists.
+
+        Returns:
+        --------
+            bool: True when the file to load exists.
+        """
+        try:
+            load_path = get_filepath_str(self._get_load_path(), self._protocol)
+        except DatasetError:
+            return False
+        return self._fs.exists(load_path)
+
+    def _describe(self) -> Dict[str, Any]:
+        """
+        Describes the chunked CSV dataset, including file path, version, and protocol.
+
+        Returns:
+        --------
+            Dict[str, Any]: A dictionary containing metadata about the dataset, such as
+                            the file path, protocol, and version.
+        """
+        return dict(
+            filepath=self._filepath, version=self._version, protocol=self._protocol
+        )
@@ -0,0 +1,56 @@
+from copy import deepcopy
+from typing import Any, Callable, Dict
+
+from kedro.io import AbstractDataset, DatasetError
+
+
+class LazyDataset(AbstractDataset):
+    """
+    A read-only dataset that loads as a function loading the wrapped dataset.
+
+    Used by the nodes that only need some data under a condition known at run time,
+    e.g. the training data of the Evidently HTML report: the data is only read when the
+    node calls the function.
+
+    Methods:
+    --------
+        _load() -> Callable[[], Any]:
+            Returns the function loading the wrapped dataset.
+
+        _save(data: Any):
+            Raises, the dataset is read-only.
+
+        _describe() -> Dict[str, Any]:
+            Describes the wrapped dataset.
+    """
+
+    def __init__(self, dataset: Dict[str, Any]):
+        """
+        Initializes the LazyDataset.
+
+        Parameters:
+        -----------
+            dataset (Dict[str, Any]): The catalog configuration of the wrapped dataset.
+        """
+        self._dataset_config = deepcopy(dataset)
+
+    def _load(self) -> Callable[[], Any]:
+        """
+        Returns the function loading the wrapped dataset.
+
+        The wrapped dataset is created when the function is called, so a versioned
+        dataset loads the latest version at that time.
+
+        Returns:
+        --------
+            Callable[[], Any]: The function returning the data.
+        """
+        return lambda: AbstractDataset.from_config(
+            "dataset", self._dataset_config
+        ).load()
+
+    def _save(self, data: Any) -> None:
+        raise DatasetError(f"{self.__class__.__name__} is a read-only dataset")
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(dataset=self._dataset_config)
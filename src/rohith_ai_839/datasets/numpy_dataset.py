@@ -0,0 +1,134 @@
+import json
+from copy import deepcopy
+from io import BytesIO
+from pathlib import PurePath
+from typing import Any, Dict, Union
+
+import fsspec
+import numpy as np
+import pandas as pd
+from kedro.io import AbstractVersionedDataset
+from kedro.io.core import Version, get_filepath_str, get_protocol_and_path
+
+
+class NumpyDataset(AbstractVersionedDataset):
+    """
+    A dataset class used to store NumPy arrays as `.npy` files.
+
+    Local files can be loaded memory-mapped (`load_args: {mmap_mode: r}`): every node,
+    thread or worker process loading the array then shares the same pages of the file
+    instead of holding its own copy.
+
+    DataFrames with a single dtype are stored the same way, their column names in a
+    `<filepath>.columns.json` file next to the array, and loaded back as DataFrames
+    wrapping the (memory-mapped) array without copying it.
+
+    Attributes:
+    -----------
+        _protocol (str): The protocol extracted from the file path (e.g., 'file', 's3').
+        _filepath (PurePath): The path to the `.npy` file, excluding the protocol.
+        _fs (fsspec.AbstractFileSystem): The file system handler based on the protocol.
+        _load_args (Dict[str, Any]): Extra arguments passed to `np.load`.
+
+    Methods:
+    --------
+        _load() -> Union[np.ndarray, pd.DataFrame]:
+            Loads the array, memory-mapped when configured and the file is local.
+
+        _save(data: Union[np.ndarray, pd.DataFrame]):
+            Saves the array or DataFrame to a `.npy` file.
+
+        _describe() -> Dict[str, Any]:
+            Provides a description of the dataset, including the file path, version,
+            and protocol used.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        load_args: Dict[str, Any] = None,
+        version: Version = None,
+    ):
+        """
+        Initializes the NumpyDataset with a specified file path and optional versioning.
+
+        Parameters:
+        -----------
+            filepath (str): The path to the `.npy` file.
+            load_args (Dict[str, Any], optional): Extra arguments passed to `np.load`.
+            version (Version, optional): Version identifier for tracking different
+            versions of the dataset. Defaults to None.
+        """
+        protocol, path = get_protocol_and_path(filepath)
+        self._protocol = protocol
+        self._filepath = PurePath(path)
+        self._fs = fsspec.filesystem(self._protocol)
+        self._load_args = deepcopy(load_args) or {}
+
+        super().__init__(
+            filepath=PurePath(path),
+            version=version,
+            exists_function=self._fs.exists,
+            glob_function=self._fs.glob,
+        )
+
+    def _load(self) -> Union[np.ndarray, pd.DataFrame]:
+        """
+        Loads the `.npy` file.
+
+        Returns:
+        --------
+            Union[np.ndarray, pd.DataFrame]: The array, a read-only `np.memmap` when
+                        `mmap_mode` is set and the file is on the local file system.
+                        A DataFrame over that array when a DataFrame was saved.
+        """
+        load_path = get_filepath_str(self._get_load_path(), self._protocol)
+
+        if self._protocol == "file":
+            data = np.load(load_path, **self._load_args)
+        else:
+            # Remote files cannot be memory-mapped, they are read in memory
+            load_args = {k: v for k, v in self._load_args.items() if k != "mmap_mode"}
+            with self._fs.open(load_path, "rb") as f:
+                data = np.load(BytesIO(f.read()), **load_args)
+
+        columns_path = f"{load_path}.columns.json"
+        if not self._fs.exists(columns_path):
+            return data
+        with self._fs.open(columns_path, "r") as f:
+            return pd.DataFrame(data, columns=json.load(f), copy=False)
+
+    def _save(self, data: Union[np.ndarray, pd.DataFrame]) -> None:
+        """
+        Saves an array or a DataFrame to a `.npy` file.
+
+        Parameters:
+        -----------
+            data (Union[np.ndarray, pd.DataFrame]): The array to save, or a DataFrame
+                        whose columns all have the same dtype.
+        """
+        save_path = get_filepath_str(self._get_save_path(), self._protocol)
+        columns_path = f"{save_path}.columns.json"
+
+        self._fs.makedirs(str(PurePath(save_path).parent), exist_ok=True)
+        if isinstance(data, pd.DataFrame):
+            with self._fs.open(columns_path, "w") as f:
+                json.dump(data.columns.tolist(), f)
+            data = np.ascontiguousarray(data.to_numpy())
+        elif self._fs.exists(columns_path):
+            self._fs.rm(columns_path)
+        with self._fs.open(save_path, "wb") as f:
+            np.save(f, data)
+
+    def _describe(self) -> Dict[str, Any]:
+        """
+        Describes the NumPy dataset, including file path, version, and protocol.
+
+        Returns:
+        --------
+            Dict[str, Any]: A dictionary containing metadata about the dataset, such as
+                            the file path, protocol, and version.
+        """
+        return dict(
+            filepath=self._filepath, version=self._version, protocol=self._protocol
+        )
@@ -0,0 +1,95 @@
+from pathlib import PurePath
+from typing import Any, Dict
+
+import fsspec
+import onnx
+from kedro.io import AbstractVersionedDataset
+from kedro.io.core import Version, get_filepath_str, get_protocol_and_path
+
+
+class ONNXModelDataset(AbstractVersionedDataset):
+    """
+    A dataset class used to store ONNX models as `.onnx` files.
+
+    Attributes:
+    -----------
+        _protocol (str): The protocol extracted from the file path (e.g., 'file', 's3').
+        _filepath (PurePath): The path to the `.onnx` file, excluding the protocol.
+        _fs (fsspec.AbstractFileSystem): The file system handler based on the protocol.
+
+    Methods:
+    --------
+        _load() -> onnx.ModelProto:
+            Loads the ONNX model.
+
+        _save(model: onnx.ModelProto):
+            Serializes the ONNX model to a `.onnx` file.
+
+        _describe() -> Dict[str, Any]:
+            Provides a description of the dataset, including the file path, version,
+            and protocol used.
+    """
+
+    def __init__(self, filepath: str, version: Version = None):
+        """
+        Initializes the ONNXModelDataset with a specified file path and optional
+        versioning.
+
+        Parameters:
+        -----------
+            filepath (str): The path to the `.onnx` file.
+            version (Version, optional): Version identifier for tracking different
+            versions of the dataset. Defaults to None.
+        """
+        protocol, path = get_protocol_and_path(filepath)
+        self._protocol = protocol
+        self._filepath = PurePath(path)
+        self._fs = fsspec.filesystem(self._protocol)
+
+        super().__init__(
+            filepath=PurePath(path),
+            version=version,
+            exists_function=self._fs.exists,
+            glob_function=self._fs.glob,
+        )
+
+    def _load(self) -> onnx.ModelProto:
+        """
+        Loads the ONNX model.
+
+        Returns:
+        --------
+            onnx.ModelProto: The model, to be run with e.g.
+            `onnxruntime.InferenceSession`.
+        """
+        load_path = get_filepath_str(self._get_load_path(), self._protocol)
+
+        with self._fs.open(load_path, "rb") as f:
+            return onnx.load_model_from_string(f.read())
+
+    def _save(self, model: onnx.ModelProto) -> None:
+        """
+        Serializes an ONNX model to a `.onnx` file.
+
+        Parameters:
+        -----------
+            model (onnx.ModelProto): The model to save.
+        """
+        save_path = get_filepath_str(self._get_save_path(), self._protocol)
+
+        self._fs.makedirs(str(PurePath(save_path).parent), exist_ok=True)
+        with self._fs.open(save_path, "wb") as f:
+            f.write(model.SerializeToString())
+
+    def _describe(self) -> Dict[str, Any]:
+        """
+        Describes the ONNX model dataset, including file path, version, and protocol.
+
+        Returns:
+        --------
+            Dict[str, Any]: A dictionary containing metadata about the dataset, such as
+                            the file path, protocol, and version.
+        """
+        return dict(
+            filepath=self._filepath, version=self._version, protocol=self._protocol
+        )
@@ -0,0 +1,29 @@
+import pandas as pd
+from kedro_datasets.pandas import ParquetDataset
+
+
+class OptionalParquetDataset(ParquetDataset):
+    """
+    A Parquet dataset that loads as an empty DataFrame until it has been saved once.
+
+    Used for the state read back by incremental nodes, which has not been written yet
+    on the first run of a pipeline.
+
+    Methods:
+    --------
+        load() -> pd.DataFrame:
+            Loads the Parquet file, or an empty DataFrame when it does not exist.
+    """
+
+    def load(self) -> pd.DataFrame:
+        """
+        Loads the Parquet file into a pandas DataFrame.
+
+        Returns:
+        --------
+            pd.DataFrame: The saved data, or an empty DataFrame if nothing was saved
+            yet.
+        """
+        if not self._exists():
+            return pd.DataFrame()
+        return super().load()
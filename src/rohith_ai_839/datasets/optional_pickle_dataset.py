@@ -0,0 +1,29 @@
+from typing import Any
+
+from kedro_datasets.pickle import PickleDataset
+
+
+class OptionalPickleDataset(PickleDataset):
+    """
+    A pickle dataset that loads as None until it has been saved once.
+
+    Used to read back the previous version of a trained model, which does not exist yet
+    on the first run of a pipeline.
+
+    Methods:
+    --------
+        load() -> Any:
+            Loads the pickled object, or None when it does not exist.
+    """
+
+    def load(self) -> Any:
+        """
+        Loads the pickled object.
+
+        Returns:
+        --------
+            Any: The saved object, or None if nothing was saved yet.
+        """
+        if not self._exists():
+            return None
+        return super().load()
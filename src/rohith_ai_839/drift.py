@@ -0,0 +1,647 @@
+"""Column drift statistics computed with NumPy for all the columns of a frame at once.
+
+`drift_report` returns the same structure as the JSON of an Evidently report with the
+``DataDriftPreset``, so that its consumers (`report_plotly`, the model comparison) read
+``report["metrics"][1]["result"]["drift_by_columns"]`` unchanged. The statistical test
+of each column follows the defaults of Evidently:
+
+- numerical columns: two-sample Kolmogorov-Smirnov test up to 1000 reference rows, the
+  Wasserstein distance normed by the reference standard deviation above;
+- categorical columns (and numerical columns with at most 5 values): chi-square test up
+  to 1000 reference rows, the population stability index (PSI) above.
+
+Every test is computed on 2D arrays, one column per feature, instead of one call per
+column: the two-sample tests share a single sort of the pooled samples, the category
+and histogram counts a single ``np.bincount`` over all the columns.
+
+The reference data is summarised once by `reference_sketch` into a small JSON
+serializable sketch: the histograms, category counts and quantiles of every column.
+Drift is then tested against the sketch, so the reference data is never reloaded. The
+quantile sketch keeps every value of columns with up to 1000 rows, where the exact
+Kolmogorov-Smirnov test is used, and 1000 quantiles above, where the Wasserstein
+distance computed from them is within a fraction of a percent of the exact one.
+
+`OnlineDriftMonitor` tracks the drift of a stream of records, such as the surveys
+submitted to the app, from the same sketch over a sliding window.
+"""
+
+import threading
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+# Evidently switches from the statistical tests to the distances above this many rows
+LARGE_SAMPLE_SIZE = 1000
+# Numerical columns with at most this many values are tested as categorical columns
+MAX_CATEGORIES = 5
+HISTOGRAM_BINS = 10
+# Number of quantiles kept in the sketch of each numerical column
+SKETCH_SIZE = LARGE_SAMPLE_SIZE
+
+# Name of each test in the report and its default threshold. The drift is detected
+# below the threshold for p-values and at or above it for distances
+STATTESTS = {
+    "ks": ("K-S p_value", 0.05),
+    "chisquare": ("chi-square p_value", 0.05),
+    "wasserstein": ("Wasserstein distance (normed)", 0.1),
+    "psi": ("PSI", 0.1),
+}
+P_VALUE_TESTS = {"ks", "chisquare"}
+
+
+def _pooled_ecdf_differences(
+    reference: np.ndarray, current: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sorts the pooled samples of every column and walks both empirical CDFs.
+
+    Args:
+        reference (np.ndarray): Reference samples, one column per feature.
+        current (np.ndarray): Current samples, one column per feature.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The pooled values sorted within each column (NaN
+            last) and, at each of them, the reference ECDF minus the current ECDF.
+    """
+    n = np.maximum((~np.isnan(reference)).sum(axis=0), 1)
+    m = np.maximum((~np.isnan(current)).sum(axis=0), 1)
+    pooled = np.concatenate([reference, current])
+    # Missing values are ignored, they weigh nothing in the ECDFs
+    weights = np.concatenate([~np.isnan(reference) / n, ~np.isnan(current) / -m])
+
+    order = np.argsort(pooled, axis=0, kind="stable")
+    values = np.take_along_axis(pooled, order, axis=0)
+    differences = np.cumsum(np.take_along_axis(weights, order, axis=0), axis=0)
+    return values, differences
+
+
+def ks_test(
+    reference: np.ndarray, current: np.ndarray, reference_size: np.ndarray = None
+) -> np.ndarray:
+    """
+    Two-sample Kolmogorov-Smirnov test of every column.
+
+    Args:
+        reference (np.ndarray): Reference samples, one column per feature.
+        current (np.ndarray): Current samples, one column per feature.
+        reference_size (np.ndarray, optional): Number of reference rows summarised by
+            each column, when `reference` holds quantiles rather than the samples.
+
+    Returns:
+        np.ndarray: The asymptotic p-value of each column.
+    """
+    values, differences = _pooled_ecdf_differences(reference, current)
+    # Tied values only count once, after the last of them
+    last_of_ties = np.ones_like(values, dtype=bool)
+    last_of_ties[:-1] = values[:-1] != values[1:]
+    statistic = np.where(last_of_ties, np.abs(differences), 0).max(axis=0)
+
+    n = (
+        (~np.isnan(reference)).sum(axis=0) if reference_size is None else reference_size
+    )
+    m = (~np.isnan(current)).sum(axis=0)
+    effective_size = np.round(n * m / np.maximum(n + m, 1))
+    return stats.kstwo.sf(statistic, np.maximum(effective_size, 1))
+
+
+def wasserstein_distance(
+    reference: np.ndarray, current: np.ndarray, reference_std: np.ndarray = None
+) -> np.ndarray:
+    """
+    Wasserstein distance of every column, normed by the reference standard deviation.
+
+    Args:
+        reference (np.ndarray): Reference samples, one column per feature.
+        current (np.ndarray): Current samples, one column per feature.
+        reference_std (np.ndarray, optional): Standard deviation of each reference
+            column, when `reference` holds quantiles rather than the samples.
+
+    Returns:
+        np.ndarray: The normed distance of each column.
+    """
+    values, differences = _pooled_ecdf_differences(reference, current)
+    # Area between the two ECDFs, summed over the gaps between consecutive values
+    gaps = np.nan_to_num(np.diff(values, axis=0))
+    distance = (np.abs(differences[:-1]) * gaps).sum(axis=0)
+    if reference_std is None:
+        reference_std = np.nanstd(reference, axis=0)
+    return distance / np.maximum(reference_std, 0.001)
+
+
+def chi_square_test(
+    reference_counts: np.ndarray, current_counts: np.ndarray
+) -> np.ndarray:
+    """
+    Chi-square goodness of fit test of the current categories to the reference ones.
+
+    Args:
+        reference_counts (np.ndarray): Count of each category in the reference data,
+            one row per feature.
+        current_counts (np.ndarray): Count of each category in the current data.
+
+    Returns:
+        np.ndarray: The p-value of each feature.
+    """
+    present = (reference_counts + current_counts) > 0
+    expected = (
+        reference_counts
+        / np.maximum(reference_counts.sum(axis=1, keepdims=True), 1)
+        * current_counts.sum(axis=1, keepdims=True)
+    )
+    # Categories missing from the reference data make the statistic infinite
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = np.where(present, (current_counts - expected) ** 2 / expected, 0)
+    statistic = np.nan_to_num(terms, nan=0.0).sum(axis=1)
+    dof = np.maximum(present.sum(axis=1) - 1, 1)
+    return stats.chi2.sf(statistic, dof)
+
+
+def population_stability_index(
+    reference_counts: np.ndarray, current_counts: np.ndarray
+) -> np.ndarray:
+    """
+    Population stability index between the reference and current categories.
+
+    Args:
+        reference_counts (np.ndarray): Count of each category in the reference data,
+            one row per feature.
+        current_counts (np.ndarray): Count of each category in the current data.
+
+    Returns:
+        np.ndarray: The PSI of each feature.
+    """
+    present = (reference_counts + current_counts) > 0
+    reference_share = reference_counts / np.maximum(
+        reference_counts.sum(axis=1, keepdims=True), 1
+    )
+    current_share = current_counts / np.maximum(
+        current_counts.sum(axis=1, keepdims=True), 1
+    )
+    # Empty categories get a small share, as in Evidently, to keep the log finite
+    reference_share = np.where(reference_share == 0, 0.0001, reference_share)
+    current_share = np.where(current_share == 0, 0.0001, current_share)
+    terms = (reference_share - current_share) * np.log(reference_share / current_share)
+    return np.where(present, terms, 0).sum(axis=1)
+
+
+def category_codes(categories: List, values: pd.Series) -> Tuple[np.ndarray, List]:
+    """
+    Encodes values with the codes of the reference categories.
+
+    Args:
+        categories (List): The categories of the reference data, from the sketch.
+        values (pd.Series): The values to encode.
+
+    Returns:
+        Tuple[np.ndarray, List]: The codes (-1 for missing values) and the categories,
+            extended with the values missing from the reference data.
+    """
+    codes = pd.Index(categories).get_indexer(values)
+    unseen = values[(codes == -1) & values.notna().to_numpy()].unique().tolist()
+    if unseen:
+        categories = categories + unseen
+        codes = pd.Index(categories).get_indexer(values)
+    return codes, categories
+
+
+def count_codes(codes: np.ndarray, n_categories: int) -> np.ndarray:
+    """
+    Counts the codes of every column in a single `np.bincount`.
+
+    Args:
+        codes (np.ndarray): Category codes, one column per feature, -1 for missing.
+        n_categories (int): Number of categories of the column with the most.
+
+    Returns:
+        np.ndarray: The counts, one row per feature and one column per category.
+    """
+    n_columns = codes.shape[1]
+    valid = codes >= 0
+    offsets = np.broadcast_to(np.arange(n_columns) * n_categories, codes.shape)
+    return np.bincount(
+        (offsets + codes)[valid], minlength=n_columns * n_categories
+    ).reshape(n_columns, n_categories)
+
+
+def histograms(data: np.ndarray, bins: int = HISTOGRAM_BINS) -> List[Dict]:
+    """
+    Density histograms of every column, as the "small_distribution" of Evidently.
+
+    Args:
+        data (np.ndarray): Samples, one column per feature.
+        bins (int): Number of bins of each histogram.
+
+    Returns:
+        List[Dict]: For each column, the bin edges "x" and the densities "y", as
+            returned by `np.histogram(..., density=True)`.
+    """
+    valid = ~np.isnan(data)
+    low = np.nanmin(np.where(valid.any(axis=0), data, 0), axis=0)
+    high = np.nanmax(np.where(valid.any(axis=0), data, 0), axis=0)
+    # Constant columns get a unit range, like np.histogram
+    constant = low == high
+    low, high = np.where(constant, low - 0.5, low), np.where(constant, high + 0.5, high)
+    width = (high - low) / bins
+
+    with np.errstate(invalid="ignore"):
+        codes = np.clip(np.floor((data - low) / width), 0, bins - 1)
+    codes = np.where(valid, codes, -1).astype(np.int64)
+    counts = count_codes(codes, bins)
+    densities = counts / np.maximum(valid.sum(axis=0), 1)[:, None] / width[:, None]
+    edges = low[:, None] + width[:, None] * np.arange(bins + 1)
+
+    return [
+        {"x": edges[i].tolist(), "y": densities[i].tolist()}
+        for i in range(data.shape[1])
+    ]
+
+
+def _numeric_columns(data: pd.DataFrame) -> List[str]:
+    return [
+        column
+        for column in data.columns
+        if pd.api.types.is_numeric_dtype(data[column])
+        and not pd.api.types.is_bool_dtype(data[column])
+    ]
+
+
+def reference_sketch(reference: pd.DataFrame, sketch_size: int = SKETCH_SIZE) -> Dict:
+    """
+    Summarises the reference data of a drift check into a JSON serializable sketch.
+
+    Args:
+        reference (pd.DataFrame): The reference data, usually the training set.
+        sketch_size (int): Number of quantiles kept for numerical columns, whose values
+            are kept as is when the reference data has at most this many rows.
+
+    Returns:
+        Dict: The number of reference "rows" and, for each of the "columns", its
+            "column_type", the "stattest" used to test it, its "count" of values, its
+            "small_distribution", and either its "categories" and their "counts" or
+            its "quantiles" and "std".
+    """
+    numeric = _numeric_columns(reference)
+    n_unique = reference[numeric].nunique()
+    continuous = [column for column in numeric if n_unique[column] > MAX_CATEGORIES]
+    large = len(reference) > LARGE_SAMPLE_SIZE
+    sketch = {"rows": len(reference), "columns": {}}
+
+    if numeric:
+        values = reference[numeric].to_numpy(dtype=np.float64)
+        counts = (~np.isnan(values)).sum(axis=0)
+        for column, count, distribution in zip(numeric, counts, histograms(values)):
+            sketch["columns"][column] = {
+                "column_type": "num",
+                "count": int(count),
+                "small_distribution": distribution,
+            }
+
+    if continuous:
+        values = reference[continuous].to_numpy(dtype=np.float64)
+        if len(reference) > sketch_size:
+            # Quantiles at the middle of equal mass intervals, each weighs
+            # 1 / sketch_size
+            levels = (np.arange(sketch_size) + 0.5) / sketch_size
+            quantiles = np.nanquantile(values, levels, axis=0)
+        else:
+            quantiles = np.sort(values, axis=0)
+        stds = np.nanstd(values, axis=0)
+        for i, column in enumerate(continuous):
+            sketch["columns"][column].update(
+                {
+                    "stattest": "wasserstein" if large else "ks",
+                    "quantiles": quantiles[~np.isnan(quantiles[:, i]), i].tolist(),
+                    "std": float(stds[i]),
+                }
+            )
+
+    for column in reference.columns:
+        if column in continuous:
+            continue
+        codes, categories = pd.factorize(reference[column], sort=True)
+        counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+        column_sketch = sketch["columns"].setdefault(
+            column,
+            {
+                "column_type": "cat",
+                "count": int(counts.sum()),
+                "small_distribution": {
+                    "x": categories.tolist(),
+                    "y": counts.tolist(),
+                },
+            },
+        )
+        column_sketch.update(
+            {
+                "stattest": "psi" if large else "chisquare",
+                "categories": categories.tolist(),
+                "counts": counts.tolist(),
+            }
+        )
+
+    # Kept in the order of the reference columns
+    sketch["columns"] = {column: sketch["columns"][column] for column in reference}
+    return sketch
+
+
+def _padded(lists: List[List[float]]) -> np.ndarray:
+    """Stacks lists of different lengths as the columns of a NaN padded array."""
+    padded = np.full((max(len(values) for values in lists), len(lists)), np.nan)
+    for i, values in enumerate(lists):
+        padded[: len(values), i] = values
+    return padded
+
+
+def drift_report(
+    reference,
+    current: pd.DataFrame,
+    drift_share: float = 0.5,
+    stattest_threshold: float = None,
+) -> Dict:
+    """
+    Tests every column of the current data for drift from the reference data.
+
+    Args:
+        reference (Union[Dict, pd.DataFrame]): The sketch of the reference data made
+            by `reference_sketch`, or the reference data itself.
+        current (pd.DataFrame): The current data, with the same columns.
+        drift_share (float): Share of drifted columns from which the whole dataset is
+            considered to drift.
+        stattest_threshold (float, optional): Threshold of every test, instead of the
+            default one of each test.
+
+    Returns:
+        Dict: The report, with the "DatasetDriftMetric" and the "DataDriftTable" and its
+            "drift_by_columns" results, structured like the JSON of an Evidently
+            report with the `DataDriftPreset`.
+    """
+    if isinstance(reference, pd.DataFrame):
+        reference = reference_sketch(reference)
+    sketches = reference["columns"]
+    columns = list(sketches)
+    current = current[columns]
+
+    by_test = {}
+    for column, sketch in sketches.items():
+        by_test.setdefault(sketch["stattest"], []).append(column)
+
+    scores, distributions = {}, {}
+
+    numeric = [c for c in columns if sketches[c]["column_type"] == "num"]
+    if numeric:
+        values = current[numeric].to_numpy(dtype=np.float64)
+        for column, distribution in zip(numeric, histograms(values)):
+            distributions[column] = distribution
+
+    for test in ("ks", "wasserstein"):
+        if test not in by_test:
+            continue
+        group = by_test[test]
+        quantiles = _padded([sketches[c]["quantiles"] for c in group])
+        values = current[group].to_numpy(dtype=np.float64)
+        if test == "ks":
+            reference_size = np.array([sketches[c]["count"] for c in group])
+            drift_scores = ks_test(quantiles, values, reference_size)
+        else:
+            reference_std = np.array([sketches[c]["std"] for c in group])
+            drift_scores = wasserstein_distance(quantiles, values, reference_std)
+        scores.update(zip(group, drift_scores.tolist()))
+
+    for test in ("chisquare", "psi"):
+        if test not in by_test:
+            continue
+        group = by_test[test]
+        codes, categories = zip(
+            *(category_codes(sketches[c]["categories"], current[c]) for c in group)
+        )
+        n_categories = max(max(len(c) for c in categories), 1)
+        reference_counts = np.zeros((len(group), n_categories), dtype=np.int64)
+        for i, column in enumerate(group):
+            counts = sketches[column]["counts"]
+            reference_counts[i, : len(counts)] = counts
+        current_counts = count_codes(np.stack(codes, axis=1), n_categories)
+        if test == "psi":
+            drift_scores = population_stability_index(reference_counts, current_counts)
+        else:
+            drift_scores = chi_square_test(reference_counts, current_counts)
+        scores.update(zip(group, drift_scores.tolist()))
+        for i, column in enumerate(group):
+            if column not in distributions:
+                distributions[column] = {
+                    "x": categories[i],
+                    "y": current_counts[i, : len(categories[i])].tolist(),
+                }
+
+    drift_by_columns = {}
+    for column in columns:
+        test = sketches[column]["stattest"]
+        name, default_threshold = STATTESTS[test]
+        threshold = (
+            default_threshold if stattest_threshold is None else stattest_threshold
+        )
+        score = scores[column]
+        drift_by_columns[column] = {
+            "column_name": column,
+            "column_type": sketches[column]["column_type"],
+            "stattest_name": name,
+            "stattest_threshold": threshold,
+            "drift_score": score,
+            "drift_detected": bool(
+                score < threshold if test in P_VALUE_TESTS else score >= threshold
+            ),
+            "current": {"small_distribution": distributions[column]},
+            "reference": {
+                "small_distribution": sketches[column]["small_distribution"]
+            },
+        }
+
+    number_of_drifted_columns = sum(
+        result["drift_detected"] for result in drift_by_columns.values()
+    )
+    share_of_drifted_columns = number_of_drifted_columns / max(len(columns), 1)
+    dataset_drift = {
+        "number_of_columns": len(columns),
+        "number_of_drifted_columns": number_of_drifted_columns,
+        "share_of_drifted_columns": share_of_drifted_columns,
+        "dataset_drift": share_of_drifted_columns >= drift_share,
+    }
+
+    return {
+        "metrics": [
+            {
+                "metric": "DatasetDriftMetric",
+                "result": {"drift_share": drift_share, **dataset_drift},
+            },
+            {
+                "metric": "DataDriftTable",
+                "result": {**dataset_drift, "drift_by_columns": drift_by_columns},
+            },
+        ]
+    }
+
+
+class OnlineDriftMonitor:
+    """
+    Drift monitor of a stream of records over a sliding window, in constant memory.
+
+    Each column is binned once from the reference sketch: numerical columns into
+    equal-frequency bins cut at the quantiles of the reference data, categorical columns
+    into their reference categories plus one bin for unseen values. The monitor keeps
+    the bin of every column for the last `window_size` records in a ring buffer, with
+    their counts; adding a record updates the counts of its bins and of the bins of the
+    record it evicts, so the population stability index of every column is available
+    at any time without rescanning the window.
+
+    Attributes:
+    -----------
+        columns (List[str]): The monitored columns.
+        window_size (int): Number of most recent records the drift is computed on.
+        min_samples (int): Number of records in the window before drift is reported.
+        threshold (float): PSI from which a column drifts.
+        drift_share (float): Share of drifted columns from which the records drift.
+
+    Methods:
+    --------
+        update(record: Dict):
+            Adds a record to the window.
+
+        report() -> Dict:
+            Returns the drift score of every column over the window.
+    """
+
+    def __init__(
+        self,
+        sketch: Dict,
+        window_size: int = 1000,
+        bins: int = HISTOGRAM_BINS,
+        min_samples: int = 50,
+        threshold: float = STATTESTS["psi"][1],
+        drift_share: float = 0.5,
+    ):
+        """
+        Initializes the monitor from the sketch of the reference data.
+
+        Parameters:
+        -----------
+            sketch (Dict): The sketch of the reference data, see `reference_sketch`.
+            window_size (int): Number of most recent records the drift is computed on.
+            bins (int): Number of equal-frequency bins of the numerical columns.
+            min_samples (int): Number of records in the window before drift is reported.
+            threshold (float): PSI from which a column drifts.
+            drift_share (float): Share of drifted columns from which the records drift.
+        """
+        self.columns = list(sketch["columns"])
+        self.window_size = window_size
+        self.min_samples = min_samples
+        self.threshold = threshold
+        self.drift_share = drift_share
+
+        continuous = [c for c, s in sketch["columns"].items() if "quantiles" in s]
+        self._continuous = np.array([c in continuous for c in self.columns])
+        self._categories = [
+            pd.Index(sketch["columns"][c].get("categories", [])) for c in self.columns
+        ]
+
+        # Inner edges of the bins of the numerical columns, padded with +inf
+        levels = np.arange(1, bins) / bins
+        self._edges = np.full((len(self.columns), bins - 1), np.inf)
+        n_bins = max([bins] + [len(c) + 1 for c in self._categories])
+        self._reference_counts = np.zeros((len(self.columns), n_bins))
+        for i, column in enumerate(self.columns):
+            column_sketch = sketch["columns"][column]
+            if self._continuous[i]:
+                quantiles = np.asarray(column_sketch["quantiles"])
+                # Tied quantiles merge bins, the unused edges stay infinite
+                edges = np.unique(np.quantile(quantiles, levels))
+                self._edges[i, : len(edges)] = edges
+                codes = (self._edges[i] <= quantiles[:, None]).sum(axis=1)
+                self._reference_counts[i] = np.bincount(codes, minlength=n_bins)
+            else:
+                counts = column_sketch["counts"]
+                self._reference_counts[i, : len(counts)] = counts
+
+        self._window = np.full((window_size, len(self.columns)), -1, dtype=np.int16)
+        self._counts = np.zeros((len(self.columns), n_bins), dtype=np.int64)
+        self._position = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _codes(self, record: Dict) -> np.ndarray:
+        """Bins the values of a record, -1 for missing values."""
+        codes = np.full(len(self.columns), -1, dtype=np.int16)
+        for i, column in enumerate(self.columns):
+            value = record.get(column)
+            if value is None or pd.isna(value):
+                continue
+            if self._continuous[i]:
+                codes[i] = (self._edges[i] <= float(value)).sum()
+            else:
+                code = self._categories[i].get_indexer([value])[0]
+                # Unseen values share the bin after the reference categories
+                codes[i] = code if code >= 0 else len(self._categories[i])
+        return codes
+
+    def update(self, record: Dict) -> None:
+        """
+        Adds a record to the window, evicting the oldest one when the window is full.
+
+        Parameters:
+        -----------
+            record (Dict): The values of the monitored columns, extra keys are ignored.
+        """
+        codes = self._codes(record)
+        rows = np.arange(len(self.columns))
+        with self._lock:
+            if self._size == self.window_size:
+                evicted = self._window[self._position]
+                np.subtract.at(
+                    self._counts, (rows[evicted >= 0], evicted[evicted >= 0]), 1
+                )
+            else:
+                self._size += 1
+            self._window[self._position] = codes
+            np.add.at(self._counts, (rows[codes >= 0], codes[codes >= 0]), 1)
+            self._position = (self._position + 1) % self.window_size
+
+    def report(self) -> Dict:
+        """
+        Computes the drift of every column over the records of the window.
+
+        Returns:
+        --------
+            Dict: The number of records in the "window", the "dataset_drift" with the
+                  number and share of drifted columns, and the PSI of every column in
+                  "drift_by_columns", with the "count" of its non-missing values in the
+                  window. No drift is detected before `min_samples` records.
+        """
+        with self._lock:
+            counts = self._counts.copy()
+            size = self._size
+
+        scores = population_stability_index(self._reference_counts, counts)
+        ready = size >= self.min_samples
+        drift_by_columns = {
+            column: {
+                "column_name": column,
+                "stattest_name": STATTESTS["psi"][0],
+                "stattest_threshold": self.threshold,
+                "drift_score": float(score),
+                "drift_detected": bool(ready and score >= self.threshold),
+                "count": int(count),
+            }
+            for column, score, count in zip(self.columns, scores, counts.sum(axis=1))
+        }
+        number_of_drifted_columns = sum(
+            result["drift_detected"] for result in drift_by_columns.values()
+        )
+        share_of_drifted_columns = number_of_drifted_columns / max(len(self.columns), 1)
+        return {
+            "window": size,
+            "number_of_columns": len(self.columns),
+            "number_of_drifted_columns": number_of_drifted_columns,
+            "share_of_drifted_columns": share_of_drifted_columns,
+            "dataset_drift": ready and share_of_drifted_columns >= self.drift_share,
+            "drift_by_columns": drift_by_columns,
+        }
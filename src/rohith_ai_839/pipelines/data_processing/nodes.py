@@ -1,9 +1,270 @@
+from typing import Dict, List, Tuple
+
+import joblib
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from sklearn.preprocessing import LabelEncoder
 
+from rohith_ai_839.datasets.chunked_csv_dataset import CSVChunks
+
+# Categorical features that are grouped before encoding: the slice of the
+# training value counts that is kept and the label everything else is mapped to
+CATEGORY_GROUPS = {
+    "Profession": (slice(1, 35), "Other"),
+    "Sleep Duration": (slice(0, 4), "1-8"),
+    "Dietary Habits": (slice(0, 3), "Moderate"),
+    "Degree": (slice(0, 27), "Other"),
+}
+
+# Columns renamed in the preprocessed datasets
+RENAMED_COLUMNS = {"Have you ever had suicidal thoughts ?": "suicidal_thoughts"}
+
+# Compact dtypes of the numeric survey answers in the preprocessed datasets
+NUMERIC_DTYPES = {
+    "Age": "float32",
+    "Academic Pressure": "int8",
+    "Work Pressure": "int8",
+    "CGPA": "float32",
+    "Study Satisfaction": "int8",
+    "Job Satisfaction": "int8",
+    "Work/Study Hours": "float32",
+    "Financial Stress": "int8",
+}
+
+
+def count_categories(
+    dataset: pd.DataFrame, offset: int = 0
+) -> Tuple[pd.Series, Dict[str, pd.DataFrame]]:
+    """
+    Counts the statistics the preprocessor is fitted from.
+
+    The counts are additive, so they can be accumulated over chunks of a dataset that
+    does not fit in memory and merged with `merge_category_counts`. Their size depends
+    on the number of distinct (City, value) pairs, not on the number of rows.
+
+    Args:
+        dataset (pd.DataFrame): The raw training dataset, or a chunk of it, without the
+            "id" column.
+        offset (int): The position of the first row of the chunk in the whole dataset.
+
+    Returns:
+        Tuple:
+            - pd.Series: The number of depressed people per city.
+            - Dict[str, pd.DataFrame]: For each categorical column, the number of rows
+              ("size") per (City, value) pair, missing values included, and the position
+              of the first of these rows ("first").
+    """
+    depressed = dataset.loc[dataset["Depression"] == 1.0, "City"].value_counts()
+    positions = pd.Series(np.arange(offset, offset + len(dataset)), index=dataset.index)
+    counts = {
+        col: positions.groupby(
+            [dataset["City"]] if col == "City" else [dataset["City"], dataset[col]],
+            dropna=False,
+        )
+        .agg(["size", "min"])
+        .rename(columns={"min": "first"})
+        for col in dataset.columns
+        if col in CATEGORY_GROUPS or dataset[col].dtype == "object"
+    }
+    return depressed, counts
+
+
+def merge_category_counts(
+    counts: Tuple[pd.Series, Dict[str, pd.DataFrame]],
+    other: Tuple[pd.Series, Dict[str, pd.DataFrame]],
+) -> Tuple[pd.Series, Dict[str, pd.DataFrame]]:
+    """
+    Adds up two results of `count_categories`.
+
+    Args:
+        counts: The counts accumulated so far.
+        other: The counts of a new chunk.
+
+    Returns:
+        Tuple: The merged counts, in the same format as `count_categories`.
+    """
+    depressed = counts[0].add(other[0], fill_value=0)
+    merged = dict(counts[1])
+    for col, pairs in other[1].items():
+        if col in merged:
+            pairs = pd.concat([merged[col], pairs])
+            pairs = pairs.groupby(level=pairs.index.names, dropna=False).agg(
+                {"size": "sum", "first": "min"}
+            )
+        merged[col] = pairs
+    return depressed, merged
+
+
+def fit_preprocessor_from_counts(
+    depressed: pd.Series, counts: Dict[str, pd.DataFrame]
+) -> Dict:
+    """
+    Fits the preprocessing artifact shared by training and inference.
+
+    The artifact captures everything `preprocess_dataset` learns from the training data,
+    so that survey inputs can later be transformed without re-reading the training set:
+    1. The whitelist of cities having at least 5 cases of depression.
+    2. The vocabularies kept for each feature in `CATEGORY_GROUPS`.
+    3. A fitted `LabelEncoder` per categorical column.
+    4. The dtype schema of the preprocessed columns: the smallest integer type holding
+       the codes of each encoder, and `NUMERIC_DTYPES` for the numeric answers.
+    5. Per categorical column, a lookup from raw value to code and the code of any other
+       value, used by `preprocess_single_record`.
+
+    Args:
+        depressed (pd.Series): The number of depressed people per city.
+        counts (Dict[str, pd.DataFrame]): The (City, value) counts per categorical
+            column, as returned by `count_categories`.
 
-def preprocess_dataset(dataset: pd.DataFrame) -> pd.DataFrame:
+    Returns:
+        Dict: The fitted preprocessor with the keys "cities", "vocabularies",
+            "encoders", "dtypes" and "lookups".
+    """
+    cities = sorted(depressed[depressed >= 5].index)
+
+    vocabularies = {}
+    encoders = {}
+    for col, pairs in counts.items():
+        # Only rows from whitelisted cities, or without a city, reach the encoders
+        city = pairs.index.get_level_values("City")
+        value_counts = pairs[city.isin(cities) | city.isna()]
+        value_counts = value_counts.groupby(level=col, dropna=False).agg(
+            {"size": "sum", "first": "min"}
+        )
+        value_counts = value_counts[value_counts["size"] > 0]
+        values = value_counts.index
+
+        if col in CATEGORY_GROUPS:
+            top, fallback = CATEGORY_GROUPS[col]
+            # Sorted like `value_counts` on the rows: from the values in order of first
+            # appearance, so that tied values keep the same order
+            vocabularies[col] = (
+                value_counts.loc[values.notna()]
+                .sort_values("first")["size"]
+                .sort_values(ascending=False)[top]
+                .index.tolist()
+            )
+            classes = set(vocabularies[col])
+            if not values.isin(vocabularies[col]).all():
+                classes.add(fallback)
+        else:
+            # Missing values are filled with zeros before encoding
+            classes = set(values.dropna())
+            if values.isna().any():
+                classes.add(0)
+
+        encoders[col] = LabelEncoder().fit(list(classes))
+
+    dtypes = dict(NUMERIC_DTYPES)
+    lookups = {}
+    for col, encoder in encoders.items():
+        dtypes[col] = np.min_scalar_type(-len(encoder.classes_)).name
+        codes = {value: code for code, value in enumerate(encoder.classes_)}
+        if col in CATEGORY_GROUPS:
+            fallback = CATEGORY_GROUPS[col][1]
+            lookups[col] = (
+                {value: codes[value] for value in vocabularies[col]},
+                codes.get(fallback, -1),
+            )
+        else:
+            lookups[col] = (codes, -1)
+
+    return {
+        "cities": cities,
+        "vocabularies": vocabularies,
+        "encoders": encoders,
+        "dtypes": dtypes,
+        "lookups": lookups,
+    }
+
+
+def fit_preprocessor(dataset: pd.DataFrame) -> Dict:
+    """
+    Fits the preprocessing artifact on an in-memory training dataset.
+
+    Args:
+        dataset (pd.DataFrame): The raw training dataset, with the columns listed in
+            `preprocess_dataset`.
+
+    Returns:
+        Dict: The fitted preprocessor, see `fit_preprocessor_from_counts`.
+    """
+    return fit_preprocessor_from_counts(
+        *count_categories(dataset.drop(["id"], axis=1))
+    )
+
+
+def transform_column(values: pd.Series, col: str, preprocessor: Dict) -> np.ndarray:
+    """
+    Transforms one column of a dataset with a fitted preprocessor.
+
+    Categorical values are grouped with the fitted vocabularies and encoded with the
+    fitted encoders through pandas categoricals, without materialising the grouped
+    strings. Values never seen during fitting are encoded as -1. Missing values are
+    filled with zeros, except for the target, and the column is cast to the dtype
+    schema of the preprocessor.
+
+    Args:
+        values (pd.Series): The raw column.
+        col (str): The name of the column.
+        preprocessor (Dict): The artifact returned by `fit_preprocessor`.
+
+    Returns:
+        np.ndarray: The transformed column.
+    """
+    encoders = preprocessor["encoders"]
+    if col in CATEGORY_GROUPS:
+        # Codes of the vocabulary, with anything else mapped to the fallback code
+        vocabulary = preprocessor["vocabularies"][col]
+        fallback = CATEGORY_GROUPS[col][1]
+        lookup = pd.Categorical(
+            vocabulary + [fallback], categories=encoders[col].classes_
+        ).codes
+        values = lookup[pd.Categorical(values, categories=vocabulary).codes]
+    elif col in encoders:
+        values = pd.Categorical(
+            values.fillna(0), categories=encoders[col].classes_
+        ).codes
+    elif col != "Depression":
+        values = values.fillna(0)
+
+    return np.asarray(values, dtype=preprocessor["dtypes"].get(col))
+
+
+def apply_preprocessor(
+    dataset: pd.DataFrame, preprocessor: Dict, n_jobs: int = 1, prefer: str = "threads"
+) -> pd.DataFrame:
+    """
+    Applies a fitted preprocessor to a dataset in a single pass over its rows.
+
+    The columns are independent, so they are transformed by `transform_column` in
+    parallel and assembled once into the result. City filtering is left to the callers,
+    as training and survey inputs treat missing cities differently.
+
+    Args:
+        dataset (pd.DataFrame): The dataset to transform, without the "id" column.
+        preprocessor (Dict): The artifact returned by `fit_preprocessor`.
+        n_jobs (int): The number of columns transformed concurrently, -1 for all cores.
+        prefer (str): "threads" or "processes", the kind of joblib workers to use.
+
+    Returns:
+        pd.DataFrame: The encoded dataset, with "Have you ever had suicidal thoughts ?"
+            renamed to "suicidal_thoughts".
+    """
+    columns = Parallel(n_jobs=n_jobs, prefer=prefer)(
+        delayed(transform_column)(dataset[col], col, preprocessor)
+        for col in dataset.columns
+    )
+
+    return pd.DataFrame(
+        dict(zip(dataset.columns, columns)), index=dataset.index
+    ).rename(columns=RENAMED_COLUMNS)
+
+
+def preprocess_dataset(
+    dataset: pd.DataFrame, n_jobs: int = 1, prefer: str = "threads"
+) -> Tuple[pd.DataFrame, Dict]:
     """
     Preprocesses the input dataset by performing a series of cleaning and transformation steps to prepare it for analysis or modeling.
 
@@ -19,8 +280,12 @@ def preprocess_dataset(dataset: pd.DataFrame) -> pd.DataFrame:
     5. Encoding categorical variables using `LabelEncoder`.
     6. Renaming the column "Have you ever had suicidal thoughts ?" to "suicidal_thoughts".
 
+    The city whitelist, vocabularies and encoders learnt along the way are returned as a
+    preprocessor, so that `preprocess_user_predictions_log` encodes survey inputs
+    exactly like the training data.
+
     Args:
-        dataset (pd.DataFrame): The input dataset containing survey data. 
+        dataset (pd.DataFrame): The input dataset containing survey data.
             Must include the following columns:
             - "id"
             - "City"
@@ -30,85 +295,118 @@ def preprocess_dataset(dataset: pd.DataFrame) -> pd.DataFrame:
             - "Degree"
             - "Have you ever had suicidal thoughts ?"
             - "Depression" (binary, 0 or 1)
+        n_jobs (int): The number of columns transformed concurrently, see
+            `apply_preprocessor`.
+        prefer (str): "threads" or "processes", the kind of workers to use.
 
     Returns:
-        pd.DataFrame: The preprocessed dataset ready for further analysis or modeling.
+        Tuple:
+            - pd.DataFrame: The preprocessed dataset ready for further analysis or
+              modeling.
+            - Dict: The fitted preprocessor, see `fit_preprocessor`.
 
     Note:
         - Ensure that the input dataset has all required columns before calling this function.
         - The function modifies categorical variables to handle sparsity and reduce dimensionality.
     """
-    # Removing ID column
-    dataset = dataset.drop(["id"], axis=1)
-
-    # Removing cities which have less than 5 depressed people
-    unique_cities = dataset["City"].unique()
-
-    # Remove fraud entries
-    for city in unique_cities:
-        num_depressed_people = dataset[dataset["City"] == city][
-            dataset["Depression"] == 1.0
-        ].count()[0]
-        if num_depressed_people < 5:
-            dataset = dataset[dataset["City"] != city]
-    # Cleaning profession feature
-    pro = (
-        dataset["Profession"].value_counts()[1:35].reset_index()["Profession"].to_list()
-    )
-    dataset["Profession"] = np.where(
-        dataset["Profession"].isin(pro), dataset["Profession"], "Other"
-    )
+    preprocessor = fit_preprocessor(dataset)
 
-    # Categorising sleep duration
-    sd = (
-        dataset["Sleep Duration"]
-        .value_counts()[0:4]
-        .reset_index()["Sleep Duration"]
-        .to_list()
-    )
-    dataset["Sleep Duration"] = np.where(
-        dataset["Sleep Duration"].isin(sd), dataset["Sleep Duration"], "1-8"
-    )
+    return transform_dataset(dataset, preprocessor, n_jobs, prefer), preprocessor
 
-    dh = (
-        dataset["Dietary Habits"]
-        .value_counts()[0:3]
-        .reset_index()["Dietary Habits"]
-        .to_list()
-    )
-    dataset["Dietary Habits"] = np.where(
-        dataset["Dietary Habits"].isin(dh), dataset["Dietary Habits"], "Moderate"
-    )
 
-    deg = dataset["Degree"].value_counts()[:27].reset_index()["Degree"].to_list()
-    dataset["Degree"] = np.where(
-        dataset["Degree"].isin(deg), dataset["Degree"], "Other"
-    )
+def preprocess_dataset_chunks(
+    dataset_chunks: CSVChunks, parameters: Dict
+) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Preprocesses a raw dataset that may not fit in memory, in two passes over its
+    chunks.
 
-    dataset = dataset.fillna(0)
+    1. The first pass accumulates the per-city depression counts and the category counts
+       the preprocessor is fitted from, see `count_categories`.
+    2. The second pass transforms each chunk with the fitted preprocessor, see
+       `transform_dataset`.
 
-    object_cols = [col for col in dataset.columns if dataset[col].dtype == "object"]
-    le = LabelEncoder()
+    Only one raw chunk is held in memory at a time while fitting, the counts growing
+    with the number of distinct categories rather than rows. The encoded chunks are then
+    concatenated into the model input, which must fit in memory: only the fit step is
+    bounded. The result is the same as `preprocess_dataset` on the whole file.
 
-    # Apply LabelEncoder to each categorical column and replace it in the DataFrame
-    for col in object_cols:
-        dataset[col] = le.fit_transform(dataset[col])
+    Args:
+        dataset_chunks (CSVChunks): A lazy view over the raw dataset.
+        parameters (Dict): Parameters defined in parameters_data_processing.yml. The
+            "chunksize" entry sets the number of rows per chunk; when empty the whole
+            dataset is loaded at once and `preprocess_dataset` is used directly. The
+            "n_jobs" and "prefer" entries configure the column-parallel transform.
+
+    Returns:
+        Tuple:
+            - pd.DataFrame: The preprocessed dataset ready for further analysis or
+              modeling.
+            - Dict: The fitted preprocessor, see `fit_preprocessor_from_counts`.
+    """
+    n_jobs, prefer = parameters["n_jobs"], parameters["prefer"]
+    chunks = dataset_chunks.with_chunksize(parameters["chunksize"])
+    if chunks.chunksize is None:
+        return preprocess_dataset(next(iter(chunks)), n_jobs, prefer)
 
-    # Renaming a column suicidal_thoughts
+    counts = None
+    offset = 0
+    for chunk in chunks:
+        chunk_counts = count_categories(chunk.drop(["id"], axis=1), offset)
+        counts = (
+            chunk_counts
+            if counts is None
+            else merge_category_counts(counts, chunk_counts)
+        )
+        offset += len(chunk)
+    preprocessor = fit_preprocessor_from_counts(*counts)
 
-    dataset = dataset.rename(
-        columns={"Have you ever had suicidal thoughts ?": "suicidal_thoughts"}
+    dataset = pd.concat(
+        [transform_dataset(chunk, preprocessor, n_jobs, prefer) for chunk in chunks]
     )
+    return dataset, preprocessor
+
+
+def transform_dataset(
+    dataset: pd.DataFrame, preprocessor: Dict, n_jobs: int = 1, prefer: str = "threads"
+) -> pd.DataFrame:
+    """
+    Transforms raw training rows with a fitted preprocessor.
+
+    Drops the "id" column, removes the cities outside the preprocessor whitelist (rows
+    without a city are kept), applies the preprocessor and fills a missing target with
+    zero.
+
+    Args:
+        dataset (pd.DataFrame): The raw training dataset, or a chunk of it.
+        preprocessor (Dict): The artifact returned by `fit_preprocessor`.
+        n_jobs (int): The number of columns transformed concurrently, see
+            `apply_preprocessor`.
+        prefer (str): "threads" or "processes", the kind of workers to use.
+
+    Returns:
+        pd.DataFrame: The preprocessed rows.
+    """
+    # Removing ID column and cities which have less than 5 depressed people (fraud
+    # entries) in a single selection
+    rows = dataset["City"].isin(preprocessor["cities"]) | dataset["City"].isna()
+    dataset = dataset.loc[rows, dataset.columns != "id"]
+
+    dataset = apply_preprocessor(dataset, preprocessor, n_jobs, prefer)
+    dataset["Depression"] = dataset["Depression"].fillna(0)
 
     return dataset
 
 
-def preprocess_user_predictions_log(dataset: pd.DataFrame, survey_inputs_log: pd.DataFrame) -> pd.DataFrame:
+def preprocess_user_predictions_log(
+    survey_inputs_log: pd.DataFrame, preprocessor: Dict
+) -> pd.DataFrame:
     """
     Preprocesses user prediction logs by aligning the survey inputs with the characteristics of the training dataset.
 
-    This function cleans and transforms the input `survey_inputs_log` dataset based on the distribution and properties of the training `dataset`. 
-    The preprocessing steps ensure consistency between the datasets for predictions.
+    This function cleans and transforms the input `survey_inputs_log` dataset with the
+    preprocessor fitted on the training `dataset`, so no training data is re-read and
+    the encodings are guaranteed to match the ones seen by the models.
 
     Steps performed:
     1. Filters cities in `survey_inputs_log` that are not present in the training dataset with at least 5 depressed cases.
@@ -118,75 +416,144 @@ def preprocess_user_predictions_log(dataset: pd.DataFrame, survey_inputs_log: pd
         - "Dietary Habits": Keeps the top 3 habits from the training dataset; others are grouped into "Moderate."
         - "Degree": Retains the top 27 degrees from the training dataset; others are grouped into "Other."
     3. Fills missing values in all columns except "Depression" with zeros.
-    4. Applies `LabelEncoder` to all categorical columns in `survey_inputs_log`.
+    4. Applies the training `LabelEncoder`s to all categorical columns in
+       `survey_inputs_log`.
     5. Renames the column "Have you ever had suicidal thoughts ?" to "suicidal_thoughts."
 
     Args:
-        dataset (pd.DataFrame): The training dataset used as a reference for preprocessing.
-            Must include the following columns:
-            - "City"
-            - "Profession"
-            - "Sleep Duration"
-            - "Dietary Habits"
-            - "Degree"
-            - "Depression" (binary, 0 or 1)
         survey_inputs_log (pd.DataFrame): The dataset containing new survey inputs for prediction.
-            Should have similar column structure to `dataset`.
+            Should have similar column structure to the training dataset.
+        preprocessor (Dict): The preprocessor fitted by `preprocess_dataset`.
 
     Returns:
         pd.DataFrame: The cleaned and transformed `survey_inputs_log` dataset ready for predictions.
 
     Note:
-        - The function aligns the distribution of categorical features in `survey_inputs_log` with `dataset`.
         - Ensure `survey_inputs_log` has the required columns before calling this function.
         - The "Depression" column in `survey_inputs_log` (if present) is not used during preprocessing.
+        - Categories never seen in the training dataset are encoded as -1.
     """
-    
-    training_dataset = dataset
-    test_dataset = survey_inputs_log
-
-   # Remove cities with less than 5 depressed people from the training dataset
-    unique_cities = training_dataset["City"].unique()
-    city_counts = training_dataset[training_dataset["Depression"] == 1.0]["City"].value_counts()
-    cities_to_keep = city_counts[city_counts >= 5].index
-    test_dataset = test_dataset[test_dataset["City"].isin(cities_to_keep)]
-    
-    # Clean the "Profession" feature
-    top_professions = training_dataset["Profession"].value_counts()[1:35].index.tolist()
-    test_dataset["Profession"] = np.where(
-        test_dataset["Profession"].isin(top_professions), test_dataset["Profession"], "Other"
-    )
-    
-    # Categorize "Sleep Duration"
-    top_sleep_durations = training_dataset["Sleep Duration"].value_counts()[0:4].index.tolist()
-    test_dataset["Sleep Duration"] = np.where(
-        test_dataset["Sleep Duration"].isin(top_sleep_durations), test_dataset["Sleep Duration"], "1-8"
-    )
-    
-    # Categorize "Dietary Habits"
-    top_dietary_habits = training_dataset["Dietary Habits"].value_counts()[0:3].index.tolist()
-    test_dataset["Dietary Habits"] = np.where(
-        test_dataset["Dietary Habits"].isin(top_dietary_habits), test_dataset["Dietary Habits"], "Moderate"
+    test_dataset = survey_inputs_log[
+        survey_inputs_log["City"].isin(preprocessor["cities"])
+    ]
+
+    return apply_preprocessor(test_dataset, preprocessor)
+
+
+def preprocess_single_record(
+    record: Dict, preprocessor: Dict, features: List[str]
+) -> np.ndarray:
+    """
+    Preprocesses a single survey response for online scoring.
+
+    Applies the same transformation as `preprocess_user_predictions_log` to one record,
+    through the plain dictionary lookups stored in the preprocessor, without building
+    any DataFrame or touching the Kedro catalog.
+
+    Args:
+        record (Dict): A raw survey response, keyed by the survey_inputs_log columns.
+            Missing answers may be absent, None or NaN.
+        preprocessor (Dict): The preprocessor fitted by `preprocess_dataset`.
+        features (List[str]): The preprocessed columns to return, in order, e.g. the
+            "features" of the model options.
+
+    Returns:
+        np.ndarray: The encoded feature values of the record.
+
+    Raises:
+        ValueError: If the city of the record is not in the preprocessor whitelist.
+    """
+    if record.get("City") not in preprocessor["cities"]:
+        raise ValueError(f"City {record.get('City')!r} is not supported by the model")
+
+    original_names = {new: old for old, new in RENAMED_COLUMNS.items()}
+    lookups = preprocessor["lookups"]
+
+    values = []
+    for feature in features:
+        col = original_names.get(feature, feature)
+        value = record.get(col)
+        missing = value is None or pd.isna(value)
+        if col in lookups:
+            codes, default = lookups[col]
+            if missing and col not in CATEGORY_GROUPS:
+                value = 0
+            values.append(codes.get(value, default))
+        else:
+            values.append(0 if missing else float(value))
+
+    return np.array(values, dtype=np.float64)
+
+
+def update_user_predictions_log(
+    survey_inputs_log: pd.DataFrame,
+    preprocessor: Dict,
+    user_accounts_predictions_log: pd.DataFrame,
+    survey_inputs_fingerprints: pd.DataFrame,
+    parameters: Dict,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Brings the preprocessed user predictions log up to date with the survey inputs.
+
+    Every survey input row is fingerprinted with a hash of its raw content and of the
+    preprocessor. In incremental mode only the rows whose fingerprint was not seen on
+    the previous run (new users, edited surveys, or a retrained preprocessor) go through
+    `preprocess_user_predictions_log`; they replace their previous version at the end of
+    the log, while the rows of erased users are dropped. The whole log is preprocessed
+    again when the previous log cannot be reused: missing, empty, or without an "id"
+    column.
+
+    Args:
+        survey_inputs_log (pd.DataFrame): The raw survey inputs of all users.
+        preprocessor (Dict): The preprocessor fitted by `preprocess_dataset`.
+        user_accounts_predictions_log (pd.DataFrame): The log produced by the previous
+            run, empty on the first run.
+        survey_inputs_fingerprints (pd.DataFrame): The fingerprints saved by the
+            previous run, empty on the first run.
+        parameters (Dict): Parameters defined in parameters_data_processing.yml. When
+            its "incremental" entry is false the whole log is preprocessed again.
+
+    Returns:
+        Tuple:
+            - pd.DataFrame: The up to date preprocessed user predictions log.
+            - pd.DataFrame: The fingerprints of the survey inputs, with the columns
+              "id", "fingerprint" and "preprocessor".
+    """
+    fingerprints = pd.DataFrame(
+        {
+            "id": survey_inputs_log["id"].to_numpy(),
+            "fingerprint": pd.util.hash_pandas_object(
+                survey_inputs_log, index=False
+            ).to_numpy(),
+            "preprocessor": joblib.hash(preprocessor),
+        }
     )
-    
-    # Categorize "Degree"
-    top_degrees = training_dataset["Degree"].value_counts()[:27].index.tolist()
-    test_dataset["Degree"] = np.where(
-        test_dataset["Degree"].isin(top_degrees), test_dataset["Degree"], "Other"
+
+    if (
+        not parameters["incremental"]
+        or survey_inputs_fingerprints.empty
+        or user_accounts_predictions_log.empty
+        or "id" not in user_accounts_predictions_log.columns
+    ):
+        return (
+            preprocess_user_predictions_log(survey_inputs_log, preprocessor),
+            fingerprints,
+        )
+
+    keys = ["fingerprint", "preprocessor"]
+    dirty = ~pd.MultiIndex.from_frame(fingerprints[keys]).isin(
+        pd.MultiIndex.from_frame(survey_inputs_fingerprints[keys])
     )
-    
-    # Fill missing values
-    test_dataset.loc[:, test_dataset.columns != "Depression"] = test_dataset.loc[:, test_dataset.columns != "Depression"].fillna(0)
-    
-    # Label encoding for object columns
-    object_cols = [col for col in test_dataset.columns if test_dataset[col].dtype == "object"]
-    le = LabelEncoder()
-    for col in object_cols:
-        test_dataset[col] = le.fit_transform(test_dataset[col])
-    
-    # Rename the column "Have you ever had suicidal thoughts ?"
-    test_dataset = test_dataset.rename(
-        columns={"Have you ever had suicidal thoughts ?": "suicidal_thoughts"}
+    clean_ids = survey_inputs_log.loc[~dirty, "id"]
+
+    log = pd.concat(
+        [
+            user_accounts_predictions_log[
+                user_accounts_predictions_log["id"].isin(clean_ids)
+            ],
+            preprocess_user_predictions_log(survey_inputs_log[dirty], preprocessor),
+        ],
+        ignore_index=True,
     )
-    
-    return test_dataset
\ No newline at end of file
+    return log, fingerprints
+
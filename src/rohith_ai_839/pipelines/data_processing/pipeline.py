@@ -1,22 +1,30 @@
 from kedro.pipeline import Pipeline, node, pipeline
 
-from .nodes import preprocess_dataset, preprocess_user_predictions_log
+from .nodes import preprocess_dataset_chunks, update_user_predictions_log
 
 
 def create_pipeline(**kwargs) -> Pipeline:
     return pipeline(
         [
             node(
-                func=preprocess_dataset,
-                inputs=["dataset"],
-                outputs="model_input_dataset",
+                func=preprocess_dataset_chunks,
+                inputs=["dataset_chunks", "params:preprocessing_options"],
+                outputs=["model_input_dataset", "preprocessor"],
                 name="preprocess_dataset_node",
+                tags=["cacheable"],
             ), 
             node(
-                func=preprocess_user_predictions_log,
-                inputs=["dataset", "survey_inputs_log"],
-                outputs="user_accounts_predictions_log",
+                func=update_user_predictions_log,
+                inputs=[
+                    "survey_inputs_log",
+                    "preprocessor",
+                    "user_accounts_predictions_log_previous",
+                    "survey_inputs_fingerprints_previous",
+                    "params:preprocessing_options",
+                ],
+                outputs=["user_accounts_predictions_log", "survey_inputs_fingerprints"],
                 name="preprocess_user_predictions_log_node",
+                tags=["cacheable"],
             ), 
         ]
     )
@@ -1,178 +1,809 @@
-import json
+import copy
 import logging
-from typing import Dict, Tuple
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.io as pio
 from evidently.metric_preset import DataDriftPreset
-from evidently.metrics import *
 from evidently.report import Report
-from evidently.tests import *
-from sklearn.ensemble import RandomForestClassifier
+from joblib import Parallel, delayed
+from mapie.classification import MapieClassifier
+from plotly.subplots import make_subplots
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
 from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import (
+    HalvingRandomSearchCV,
+    ParameterGrid,
+    StratifiedKFold,
+    train_test_split,
+)
 from sklearn.tree import DecisionTreeClassifier
 from xgboost import XGBClassifier
-from mapie.classification import MapieClassifier
 
+from rohith_ai_839.drift import drift_report, reference_sketch
 
 
 def split_data(data: pd.DataFrame, parameters: Dict) -> Tuple:
-    """Splits data into features and targets training and test sets.
+    """Splits data into features and targets training, test and calibration sets.
+
+    The calibration set is carved out of the training set: the models are fit on the
+    remaining training rows and their conformal wrappers are calibrated on rows the
+    models have not seen, so each model is fit exactly once.
+
+    The features used for training are also returned as float32 DataFrames, the dtype
+    the tree models use internally, so that the training nodes share memory-mapped
+    arrays instead of each parsing and converting the data. They keep their column
+    names, so the models know the names of their features (`feature_names_in_`) like
+    the DataFrames the app, SHAP and the MLflow model pass them. The labels keep their
+    integer dtype, so the models predict integer classes.
 
     Args:
         data: Data containing features and target.
         parameters: Parameters defined in parameters/data_science.yml.
     Returns:
-        Split data.
+        Split data: `X_train` and `X_test` as DataFrames, `y_test` as a single column
+        DataFrame so that it can be stored in a columnar format, `X_calib` and
+        `X_train_array` as float32 DataFrames, and `y_train` and `y_calib` as arrays.
     """
     X = data[parameters["features"]]
     y = data["Depression"]
     X_train, X_test, y_train, y_test = train_test_split(
         X, y, test_size=parameters["test_size"], random_state=parameters["random_state"]
     )
-    return X_train, X_test, y_train, y_test
+    X_train, X_calib, y_train, y_calib = train_test_split(
+        X_train,
+        y_train,
+        test_size=parameters["calibration_size"],
+        random_state=parameters["random_state"],
+    )
+    return (
+        X_train,
+        X_test,
+        y_train.to_numpy(),
+        y_test.to_frame(),
+        to_float32_frame(X_calib),
+        y_calib.to_numpy(),
+        to_float32_frame(X_train),
+    )
+
+
+def to_float32_frame(data: pd.DataFrame) -> pd.DataFrame:
+    """Converts the columns of a DataFrame to float32, keeping their names."""
+    return data.astype(np.float32)
+
+
+def thread_budget(parameters: Dict, model: str) -> int:
+    """Returns the number of threads a model may use while it is trained.
+
+    The candidate models are independent nodes: with `kedro run --runner=ThreadRunner`
+    (or `ParallelRunner`) they are trained at the same time, so each one gets its own
+    share of the cores instead of every model trying to use all of them.
+
+    The budget is the `n_jobs` of the models that have one (random forest, XGBoost).
+    Histogram Gradient Boosting runs on the OpenMP pool of the process, which is not
+    capped per node: the cap is process-wide and concurrent nodes would overwrite it.
+    Set OMP_NUM_THREADS to bound it.
+
+    Args:
+        parameters: The `training_options` defined in parameters/data_science.yml.
+        model: Name of the model, a key of `training_options.n_jobs`.
+    Returns:
+        The thread budget of the model, 1 when it is not configured.
+    """
+    return parameters.get("n_jobs", {}).get(model, 1)
+
+
+def training_profile(parameters: Dict, model: str) -> Dict:
+    """Returns the settings the selected training profile applies to a model.
+
+    Args:
+        parameters: The `training_options` defined in parameters/data_science.yml.
+        model: Name of the model, a key of `MODEL_REGISTRY`.
+    Returns:
+        The hyperparameters of the model set by `training_options.profile`, e.g. the
+        histogram tree method of XGBoost in the "fast" profile.
+    """
+    profile = parameters.get("profile", "default")
+    return parameters.get("profiles", {}).get(profile, {}).get(model, {})
+
+
+def fit_with_conformal(
+    regressor,
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    X_calib: pd.DataFrame,
+    y_calib: pd.Series,
+    **fit_params,
+) -> Tuple:
+    """Fits a model and calibrates its conformal wrapper on the calibration set.
+
+    The wrapper is built in "prefit" mode, so it reuses the fitted model instead of
+    refitting it on cross-validation folds. The wall time of the fit, in seconds, is
+    stored in the `fit_time_` attribute of the model.
+
+    Args:
+        regressor: The model to fit.
+        X_train: Training data of independent features.
+        y_train: Training data for target decision.
+        X_calib: Calibration data of independent features.
+        y_calib: Calibration data for target decision.
+        **fit_params: Extra arguments of the `fit` method of the model.
+
+    Returns:
+        The trained model and its calibrated `MapieClassifier`.
+    """
+    start = time.perf_counter()
+    regressor.fit(X_train, y_train, **fit_params)
+    regressor.fit_time_ = time.perf_counter() - start
+    mapie = MapieClassifier(regressor, method="score", cv="prefit")
+    mapie.fit(X_calib, y_calib)
+
+    return regressor, mapie
+
+
+def make_estimator(
+    model: str, n_jobs: int = 1, profile: Dict = None, **hyperparameters
+):
+    """Builds an untrained candidate model.
+
+    Args:
+        model: Name of the model, a key of `MODEL_REGISTRY`.
+        n_jobs: Thread budget of the model, for the models that support it.
+        profile: Settings of the training profile, see `training_profile`.
+        **hyperparameters: Hyperparameters overriding the defaults of the model and the
+            settings of the profile.
+
+    Returns:
+        The untrained model.
+    """
+    if model not in MODEL_REGISTRY:
+        raise ValueError(f"Unknown model: {model}")
+    regressor = MODEL_REGISTRY[model].estimator(n_jobs)
+    return regressor.set_params(**{**(profile or {}), **hyperparameters})
+
+
+def can_warm_start(
+    previous, regressor, X_train: pd.DataFrame, parameters: Dict
+) -> bool:
+    """Tells whether a model can continue the training of its previous version.
+
+    Warm starts are only used when enabled in `training_options.warm_start` and when the
+    previous version is the same kind of model, trained on the same features.
+
+    Note:
+        A warm-started model keeps what its previous version learned, including from
+        rows removed since then: retrain from scratch after erasing personal data.
+
+    Args:
+        previous: The previous version of the model, None before the first run.
+        regressor: The untrained model.
+        X_train: Training data of independent features.
+        parameters: The `training_options` defined in parameters/data_science.yml.
+
+    Returns:
+        True when the model can be warm-started from `previous`.
+    """
+    return (
+        parameters.get("warm_start", {}).get("enabled", False)
+        and type(previous) is type(regressor)
+        and getattr(previous, "n_features_in_", None) == X_train.shape[1]
+    )
+
+
+def can_grow(n_estimators: int, parameters: Dict) -> bool:
+    """Tells whether a warm-started ensemble can add trees to its previous version.
+
+    Every warm start adds `warm_start.n_estimators` trees or boosting rounds, so the
+    ensemble would grow with each retraining. Once it would exceed
+    `warm_start.max_n_estimators`, the model is trained from scratch instead.
+
+    Args:
+        n_estimators: Number of trees or boosting rounds of the previous version.
+        parameters: The `training_options` defined in parameters/data_science.yml.
+
+    Returns:
+        True when the grown ensemble stays within the cap.
+    """
+    warm_start = parameters["warm_start"]
+    return n_estimators + warm_start["n_estimators"] <= warm_start["max_n_estimators"]
+
+
+def same_hyperparameters(previous, regressor) -> bool:
+    """Tells whether a model is configured like the previous version it would grow.
+
+    The number of trees, the thread budget and the warm start flag are set by the warm
+    start itself and are not compared. When another hyperparameter changed, e.g. after a
+    new search or with another training profile, the model is trained from scratch.
+
+    Args:
+        previous: The previous version of the model.
+        regressor: The untrained model, with the current hyperparameters.
+
+    Returns:
+        True when all the other hyperparameters are equal.
+    """
+    ignored = {"n_estimators", "n_jobs", "warm_start"}
+    current = regressor.get_params()
+    return all(
+        value == current.get(key)
+        for key, value in previous.get_params().items()
+        if key not in ignored
+    )
 
 
 def train_logistic_regression(
-    X_train: pd.DataFrame, y_train: pd.Series
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    X_calib: pd.DataFrame,
+    y_calib: pd.Series,
+    hyperparameters: Dict,
+    previous,
+    parameters: Dict,
 ) -> LogisticRegression:
     """Trains the Logistic regression model.
 
     Args:
         X_train: Training data of independent features.
         y_train: Training data for target decision.
+        X_calib: Calibration data of independent features.
+        y_calib: Calibration data for target decision.
+        hyperparameters: Hyperparameters selected by `search_hyperparameters`.
+        previous: The previous version of the model, None before the first run.
+        parameters: The `training_options` defined in parameters/data_science.yml.
 
     Returns:
-        Trained model.
+        Trained model and its conformal wrapper.
     """
-    regressor = LogisticRegression(penalty="l2", C=0.01, max_iter=1000)
-    mapie = MapieClassifier(regressor, method="score")
-    regressor.fit(X_train, y_train)
-    mapie.fit(X_train, y_train)
+    n_jobs = thread_budget(parameters, "logistic_regression")
+    regressor = make_estimator(
+        "logistic_regression",
+        n_jobs,
+        training_profile(parameters, "logistic_regression"),
+        **hyperparameters,
+    )
+    if can_warm_start(previous, regressor, X_train, parameters):
+        # The solver starts from the previous coefficients
+        regressor.set_params(warm_start=True)
+        regressor.coef_ = previous.coef_.copy()
+        regressor.intercept_ = previous.intercept_.copy()
 
-    return regressor, mapie
+    return fit_with_conformal(regressor, X_train, y_train, X_calib, y_calib)
 
 
-def train_random_forest(X_train: pd.DataFrame, y_train: pd.Series):
+def train_random_forest(
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    X_calib: pd.DataFrame,
+    y_calib: pd.Series,
+    hyperparameters: Dict,
+    previous,
+    parameters: Dict,
+):
     """Trains the Random Forest model.
 
     Args:
         X_train: Training data of independent features.
         y_train: Training data for target decision.
+        X_calib: Calibration data of independent features.
+        y_calib: Calibration data for target decision.
+        hyperparameters: Hyperparameters selected by `search_hyperparameters`.
+        previous: The previous version of the model, None before the first run.
+        parameters: The `training_options` defined in parameters/data_science.yml.
 
     Returns:
-        Trained model.
+        Trained model and its conformal wrapper.
     """
-    regressor = RandomForestClassifier(random_state=42)
-    mapie = MapieClassifier(regressor, method="score")
-    regressor.fit(X_train, y_train)
-    mapie.fit(X_train, y_train)
+    n_jobs = thread_budget(parameters, "random_forest")
+    regressor = make_estimator(
+        "random_forest",
+        n_jobs,
+        training_profile(parameters, "random_forest"),
+        **hyperparameters,
+    )
+    if (
+        can_warm_start(previous, regressor, X_train, parameters)
+        and can_grow(len(previous.estimators_), parameters)
+        and same_hyperparameters(previous, regressor)
+    ):
+        # Keeps the previous trees and only fits the added ones. The loaded model is
+        # copied, fitting it in place would change the "previous" version as well.
+        regressor = copy.deepcopy(previous).set_params(
+            n_jobs=n_jobs,
+            warm_start=True,
+            n_estimators=previous.n_estimators
+            + parameters["warm_start"]["n_estimators"],
+        )
 
-    return regressor, mapie
+    return fit_with_conformal(regressor, X_train, y_train, X_calib, y_calib)
 
 
 def train_decision_tree(
-    X_train: pd.DataFrame, y_train: pd.Series
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    X_calib: pd.DataFrame,
+    y_calib: pd.Series,
+    hyperparameters: Dict,
+    parameters: Dict,
 ) -> DecisionTreeClassifier:
     """Trains the Decision Tree model.
 
     Args:
         X_train: Training data of independent features.
         y_train: Training data for target decision.
+        X_calib: Calibration data of independent features.
+        y_calib: Calibration data for target decision.
+        hyperparameters: Hyperparameters selected by `search_hyperparameters`.
+        parameters: The `training_options` defined in parameters/data_science.yml.
 
     Returns:
-        Trained model.
+        Trained model and its conformal wrapper.
     """
 
-    regressor = DecisionTreeClassifier(max_depth=10, random_state=42)
-    mapie = MapieClassifier(regressor, method="score")
-    regressor.fit(X_train, y_train)
-    mapie.fit(X_train, y_train)
+    n_jobs = thread_budget(parameters, "decision_tree")
+    regressor = make_estimator(
+        "decision_tree",
+        n_jobs,
+        training_profile(parameters, "decision_tree"),
+        **hyperparameters,
+    )
 
-    return regressor, mapie
+    return fit_with_conformal(regressor, X_train, y_train, X_calib, y_calib)
 
 
-def train_xg_boost(X_train: pd.DataFrame, y_train: pd.Series):
-    """Trains the Decision Tree model.
+def train_xg_boost(
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    X_calib: pd.DataFrame,
+    y_calib: pd.Series,
+    hyperparameters: Dict,
+    previous,
+    parameters: Dict,
+):
+    """Trains the XGBoost model.
 
     Args:
         X_train: Training data of independent features.
         y_train: Training data for target decision.
+        X_calib: Calibration data of independent features.
+        y_calib: Calibration data for target decision.
+        hyperparameters: Hyperparameters selected by `search_hyperparameters`.
+        previous: The previous version of the model, None before the first run.
+        parameters: The `training_options` defined in parameters/data_science.yml.
 
     Returns:
-        Trained model.
+        Trained model and its conformal wrapper.
     """
 
-    regressor = XGBClassifier(random_state=42)
-    mapie = MapieClassifier(regressor, method="score")
-    regressor.fit(X_train, y_train)
-    mapie.fit(X_train, y_train)
+    n_jobs = thread_budget(parameters, "xg_boost")
+    regressor = make_estimator(
+        "xg_boost",
+        n_jobs,
+        training_profile(parameters, "xg_boost"),
+        **hyperparameters,
+    )
+    if can_warm_start(previous, regressor, X_train, parameters) and can_grow(
+        previous.get_booster().num_boosted_rounds(), parameters
+    ):
+        # Adds boosting rounds to a copy of the previous booster
+        regressor.set_params(n_estimators=parameters["warm_start"]["n_estimators"])
+        return fit_with_conformal(
+            regressor,
+            X_train,
+            y_train,
+            X_calib,
+            y_calib,
+            xgb_model=previous.get_booster(),
+        )
+
+    return fit_with_conformal(regressor, X_train, y_train, X_calib, y_calib)
 
-    return regressor, mapie
 
+def train_hist_gradient_boosting(
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    X_calib: pd.DataFrame,
+    y_calib: pd.Series,
+    hyperparameters: Dict,
+    parameters: Dict,
+) -> HistGradientBoostingClassifier:
+    """Trains the Histogram Gradient Boosting model.
 
+    Args:
+        X_train: Training data of independent features.
+        y_train: Training data for target decision.
+        X_calib: Calibration data of independent features.
+        y_calib: Calibration data for target decision.
+        hyperparameters: Hyperparameters selected by `search_hyperparameters`.
+        parameters: The `training_options` defined in parameters/data_science.yml.
 
-def quality_drift_check(
+    Returns:
+        Trained model and its conformal wrapper.
+    """
+    n_jobs = thread_budget(parameters, "hist_gradient_boosting")
+    regressor = make_estimator(
+        "hist_gradient_boosting",
+        n_jobs,
+        training_profile(parameters, "hist_gradient_boosting"),
+        **hyperparameters,
+    )
+
+    return fit_with_conformal(regressor, X_train, y_train, X_calib, y_calib)
+
+
+def search_hyperparameters(
     X_train: pd.DataFrame,
+    y_train: pd.Series,
+    parameters: Dict,
+    training_options: Dict,
+    model: str,
+) -> Tuple[Dict, pd.DataFrame]:
+    """Searches the hyperparameters of a candidate model with successive halving.
+
+    Random candidates drawn from the search space of the model are cross-validated on a
+    small share of the training rows; only the best `1 / factor` of them are evaluated
+    again with `factor` times more rows, until a single candidate is left. The search
+    cost is therefore bounded by a few fits on the whole training set, whatever the
+    number of candidates.
+
+    Args:
+        X_train: Training data of independent features.
+        y_train: Training data for target decision.
+        parameters: The `hyperparameter_search` options defined in
+            parameters/data_science.yml.
+        training_options: The `training_options` defined in parameters/data_science.yml,
+            the thread budget of the model is used to run the cross-validation fits.
+        model: Name of the model, a key of `MODEL_REGISTRY`.
+
+    Returns:
+        Tuple:
+            - hyperparameters (dict): The best hyperparameters, empty when the search is
+              disabled or the model has no search space.
+            - trials (pd.DataFrame): Iteration, number of rows, hyperparameters and
+              cross-validated scores of every evaluated candidate.
+    """
+    space = parameters.get("spaces", {}).get(model)
+    if not parameters.get("enabled", False) or not space:
+        return {}, pd.DataFrame()
+
+    search = HalvingRandomSearchCV(
+        make_estimator(model, profile=training_profile(training_options, model)),
+        space,
+        n_candidates=min(parameters["n_candidates"], len(ParameterGrid(space))),
+        factor=parameters["factor"],
+        min_resources="exhaust",
+        max_resources=parameters.get("max_resources") or "auto",
+        aggressive_elimination=True,
+        cv=StratifiedKFold(
+            parameters["cv"], shuffle=True, random_state=parameters["random_state"]
+        ),
+        scoring=parameters["scoring"],
+        refit=False,
+        n_jobs=thread_budget(training_options, model),
+        random_state=parameters["random_state"],
+    )
+    search.fit(X_train, y_train)
+
+    logger = logging.getLogger(__name__)
+    logger.info(
+        "Best %s hyperparameters: %s (%s of %.3f).",
+        model,
+        search.best_params_,
+        parameters["scoring"],
+        search.best_score_,
+    )
+
+    trials = pd.DataFrame(search.cv_results_)[
+        ["iter", "n_resources", "params", "mean_test_score", "std_test_score"]
+    ]
+    trials["params"] = trials["params"].astype(str)
+
+    return search.best_params_, trials
+
+
+class RegisteredModel(NamedTuple):
+    """A candidate model of `MODEL_REGISTRY`."""
+
+    display_name: str
+    # Builds the untrained model with its default settings from its thread budget
+    estimator: Callable[[int], Any]
+    train: Callable
+    # Whether `train` takes the previous version of the model, to warm-start from it
+    warm_start: bool = False
+
+
+# Candidate models, by name. The data_science pipeline creates one training node per
+# entry, saving "regressor_<name>" and "conformal_<name>", and evaluates all of them.
+MODEL_REGISTRY = {
+    "logistic_regression": RegisteredModel(
+        "Logistic Regression",
+        lambda n_jobs: LogisticRegression(penalty="l2", C=0.01, max_iter=1000),
+        train_logistic_regression,
+        warm_start=True,
+    ),
+    "random_forest": RegisteredModel(
+        "Random Forest",
+        lambda n_jobs: RandomForestClassifier(random_state=42, n_jobs=n_jobs),
+        train_random_forest,
+        warm_start=True,
+    ),
+    "xg_boost": RegisteredModel(
+        "XG Boost",
+        # XGBoost passes n_jobs on to its booster as the nthread parameter
+        lambda n_jobs: XGBClassifier(random_state=42, n_jobs=n_jobs),
+        train_xg_boost,
+        warm_start=True,
+    ),
+    "decision_tree": RegisteredModel(
+        "Decision Tree",
+        lambda n_jobs: DecisionTreeClassifier(max_depth=10, random_state=42),
+        train_decision_tree,
+    ),
+    "hist_gradient_boosting": RegisteredModel(
+        "Histogram Gradient Boosting",
+        lambda n_jobs: HistGradientBoostingClassifier(random_state=42),
+        train_hist_gradient_boosting,
+    ),
+}
+
+
+def sketch_reference_data(X_train: pd.DataFrame, y_test: pd.DataFrame) -> Tuple:
+    """
+    Summarises the reference data of the drift checks into compact sketches.
+
+    The histograms, quantiles and category counts of every column are computed once at
+    training time, so that the drift checks never reload the reference data.
+
+    Parameters
+    ----------
+    X_train : pd.DataFrame
+        The reference dataset of the data drift check.
+    y_test : pd.DataFrame
+        The reference target values of the prediction drift check.
+
+    Returns
+    -------
+    tuple
+        The sketches of `X_train` and `y_test`, see
+        `rohith_ai_839.drift.reference_sketch`.
+    """
+    return reference_sketch(X_train), reference_sketch(y_test)
+
+
+def quality_drift_check(
+    X_train_sketch: Dict,
     X_test: pd.DataFrame,
+    parameters: Dict,
+    load_X_train: Callable[[], pd.DataFrame] = None,
 ):
     """
     Checks for data drift between training and test datasets using predefined metrics.
 
-    This function runs a data drift analysis between the provided training (`X_train`)
-    and test (`X_test`) datasets. It generates a drift report using the `Report` class
-    with the `DataDriftPreset` metrics and returns the report in JSON format.
+    This function tests every column of the test dataset (`X_test`) for drift from the
+    sketch of the training dataset with `rohith_ai_839.drift.drift_report`, which
+    computes the statistics of all the columns at once with NumPy and returns the same
+    structure as the JSON of an Evidently report with the `DataDriftPreset`. The
+    Evidently HTML report is only rendered when "html_report" is set, as it takes
+    seconds per run and needs the training dataset itself, which is only loaded then.
 
     Parameters
     ----------
-    X_train : pd.DataFrame
-        The reference dataset (usually the training dataset) to check for data drift.
+    X_train_sketch : dict
+        The sketch of the reference dataset (usually the training dataset).
     X_test : pd.DataFrame
         The current dataset (usually the test dataset) to compare against the reference dataset.
+    parameters : dict
+        The drift options: "drift_share", "stattest_threshold" and "html_report".
+    load_X_train : callable, optional
+        Loads the reference dataset, for the HTML report.
 
     Returns
     -------
     dict
         A dictionary containing the drift report results in JSON format.
     """
+    if parameters.get("html_report", False):
+        report = Report(
+            metrics=[
+                DataDriftPreset(),
+            ]
+        )
+        report.run(reference_data=load_X_train(), current_data=X_test)
+        report.save_html("data/08_reporting/data_drift.html")
+
+    return drift_report(
+        X_train_sketch,
+        X_test,
+        drift_share=parameters.get("drift_share", 0.5),
+        stattest_threshold=parameters.get("stattest_threshold"),
+    )
 
-    report = Report(
-        metrics=[
-            DataDriftPreset(),
-        ]
+
+def binary_classification_metrics(y_true, y_pred) -> List[float]:
+    """Computes the accuracy, precision, recall and F1 score of binary predictions.
+
+    The four scores are derived from a single confusion matrix, counted in one pass over
+    the labels, instead of rescanning them once per sklearn metric function. Like
+    sklearn, precision, recall and F1 are 0 when their denominator is 0.
+
+    Args:
+        y_true: True binary labels.
+        y_pred: Predicted binary labels.
+
+    Returns:
+        The accuracy, precision, recall and F1 score.
+    """
+    y_true = np.ravel(y_true).astype(np.int64)
+    y_pred = np.ravel(y_pred).astype(np.int64)
+    tn, fp, fn, tp = np.bincount(2 * y_true + y_pred, minlength=4)
+
+    accuracy = (tp + tn) / len(y_true)
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * tp / (2 * tp + fp + fn) if tp + fp + fn else 0.0
+
+    return [float(accuracy), float(precision), float(recall), float(f1)]
+
+
+def evaluate_model(
+    regressor, X_test: pd.DataFrame, y_test, latency_samples: int = 200
+) -> Tuple:
+    """Predicts the test set with a model, scores the predictions and times the model.
+
+    Besides the fit time recorded by `fit_with_conformal`, the throughput of a batch
+    prediction of the whole test set and the latency of single-row predictions, as made
+    by the app for each survey, are measured.
+
+    Args:
+        regressor: Trained model.
+        X_test: Test dataset features.
+        y_test: Test dataset target labels.
+        latency_samples: Number of test rows predicted one at a time.
+
+    Returns:
+        The metrics of `binary_classification_metrics`, the predictions, and a dict with
+        the "training_time" (s), "latency_p50_ms", "latency_p99_ms" and "throughput"
+        (rows/s) of the model.
+    """
+    # The models are trained on float32 features, see `split_data`
+    X = to_float32_frame(X_test)
+
+    start = time.perf_counter()
+    y_pred = regressor.predict(X)
+    batch_time = time.perf_counter() - start
+
+    latencies = []
+    for i in range(min(latency_samples, len(X))):
+        row = X[i : i + 1]
+        start = time.perf_counter()
+        regressor.predict(row)
+        latencies.append(time.perf_counter() - start)
+    latency_p50, latency_p99 = np.percentile(latencies, [50, 99]) * 1000
+
+    timings = {
+        "training_time": float(getattr(regressor, "fit_time_", np.nan)),
+        "latency_p50_ms": float(latency_p50),
+        "latency_p99_ms": float(latency_p99),
+        "throughput": len(X) / batch_time,
+    }
+    return binary_classification_metrics(y_test, y_pred), y_pred, timings
+
+
+def score_fold(
+    model: str,
+    hyperparameters: Dict,
+    X_fit: np.ndarray,
+    y_fit: np.ndarray,
+    X_eval: np.ndarray,
+    y_eval: np.ndarray,
+) -> List[float]:
+    """Fits a candidate model on the training rows of a fold, scores it on the rest.
+
+    Args:
+        model: Name of the model, a key of `MODEL_REGISTRY`.
+        hyperparameters: Hyperparameters selected by `search_hyperparameters`.
+        X_fit: Features of the training rows of the fold.
+        y_fit: Target of the training rows of the fold.
+        X_eval: Features of the held-out rows of the fold.
+        y_eval: Target of the held-out rows of the fold.
+
+    Returns:
+        The metrics of `binary_classification_metrics` on the held-out rows.
+    """
+    regressor = make_estimator(model, **hyperparameters).fit(X_fit, y_fit)
+    return binary_classification_metrics(y_eval, regressor.predict(X_eval))
+
+
+def cross_validate_models(
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    parameters: Dict,
+    **hyperparameters,
+) -> Dict:
+    """Scores every candidate model with stratified k-fold cross-validation.
+
+    The folds are drawn and sliced once, then shared by all the models. The fits of
+    every (model, fold) pair are spread over a pool of
+    `training_options.cross_validation.n_jobs` processes.
+
+    Args:
+        X_train: Training data of independent features.
+        y_train: Training data for target decision.
+        parameters: The `training_options` defined in parameters/data_science.yml.
+        **hyperparameters: Hyperparameters of each model, keyed by its name in
+            `MODEL_REGISTRY`.
+
+    Returns:
+        The mean and standard deviation over the folds of the accuracy, precision,
+        recall and F1 score of each model, e.g.
+        {"xg_boost": {"mean": [...], "std": [...]}}. Empty when cross-validation is
+        disabled.
+    """
+    options = parameters.get("cross_validation", {})
+    if not options.get("enabled", False):
+        return {}
+
+    X = np.asarray(X_train)
+    y = np.ravel(y_train)
+    folds = StratifiedKFold(
+        options["n_splits"], shuffle=True, random_state=options["random_state"]
+    ).split(X, y)
+    folds = [(X[fit], y[fit], X[held_out], y[held_out]) for fit, held_out in folds]
+
+    results = Parallel(n_jobs=options.get("n_jobs", 1))(
+        delayed(score_fold)(
+            model,
+            {**training_profile(parameters, model), **model_hyperparameters},
+            *fold,
+        )
+        for model, model_hyperparameters in hyperparameters.items()
+        for fold in folds
     )
-    report.run(reference_data=X_train, current_data=X_test)
-    report.save_html("data/08_reporting/data_drift.html")
-    data_drift_str = str(report.json)
 
-    return json.loads(report.json())
+    scores = {}
+    for i, model in enumerate(hyperparameters):
+        model_results = np.array(results[i * len(folds) : (i + 1) * len(folds)])
+        scores[model] = {
+            "mean": model_results.mean(axis=0).tolist(),
+            "std": model_results.std(axis=0).tolist(),
+        }
+    return scores
 
 
 def evaluate_all_models(
-    regressor_logistic_regression,
-    regressor_random_forest,
-    regressor_xg_boost,
-    regressor_decision_tree,
     X_test: pd.DataFrame,
-    y_test: pd.Series,
-) -> pd.Series:
+    y_test: pd.DataFrame,
+    parameters: Dict,
+    cv_scores: Dict,
+    **models,
+) -> Tuple:
     """
     Evaluates multiple machine learning models on test data and selects the best model based on the F1 score.
 
-    This function calculates the accuracy, precision, recall, and F1 score for each provided model. 
-    It logs the performance metrics and determines the best model based on the highest F1 score. 
-    Additionally, it returns the predictions, metrics, and the selected model.
+    The models are the entries of `MODEL_REGISTRY`, passed by name. Each one is scored
+    and timed by `evaluate_model`, in parallel threads when
+    `training_options.evaluation_n_jobs` is above 1 (the timings are then measured under
+    contention), so adding a candidate to the registry needs no extra evaluation code.
+
+    Models whose p99 single-row latency exceeds
+    `training_options.selection.latency_budget_ms` are not selected, whatever their F1
+    score.
+
+    When `cv_scores` is not empty, the model is selected on its mean cross-validated F1
+    score rather than on the single test split, and the reported metrics are the means
+    and standard deviations over the folds.
 
     Args:
-        regressor_logistic_regression: Trained Logistic Regression model.
-        regressor_random_forest: Trained Random Forest model.
-        regressor_xg_boost: Trained XGBoost model.
-        regressor_decision_tree: Trained Decision Tree model.
         X_test (pd.DataFrame): Test dataset features.
-        y_test (pd.Series): Test dataset target labels.
+        y_test (pd.DataFrame): Test dataset target labels.
+        parameters (Dict): The `training_options` defined in
+            parameters/data_science.yml.
+        cv_scores (Dict): Scores returned by `cross_validate_models`, empty when
+            cross-validation is disabled.
+        **models: Trained models, keyed by their name in `MODEL_REGISTRY`.
 
     Returns:
         Tuple:
@@ -182,8 +813,13 @@ def evaluate_all_models(
                 - "value_2": Precision score.
                 - "value_3": Recall score.
                 - "value_4": F1 score.
+                With cross-validation, "value_1_std" to "value_4_std" hold the standard
+                deviations over the folds. The timings of `evaluate_model` are added.
             - regressor: The best-performing model object.
             - regressor: Duplicate reference to the best-performing model object for consistency.
+            - model_selection_name (dict): The name of the best-performing model.
+            - model_scores (pd.DataFrame): The test metrics and timings of every model,
+              to trade accuracy for retraining and serving speed.
 
     Logs:
         - The accuracy, precision, recall, and F1 score for each model.
@@ -191,188 +827,176 @@ def evaluate_all_models(
 
     Notes:
         - The function assumes all models implement the `predict` method.
-        - The `y_test` must be binary for the `precision_score`, `recall_score`, and `f1_score` metrics to work correctly.
-    """
-    metrics = {}
+        - The `y_test` must be binary.
+        - On equal F1 scores, the model listed first in `MODEL_REGISTRY` is selected.
 
-    y_pred = regressor_logistic_regression.predict(X_test)
-    score = accuracy_score(y_test, y_pred)
-    precision = precision_score(y_test, y_pred)
-    recall = recall_score(y_test, y_pred)
-    f1 = f1_score(y_test, y_pred)
-    logger = logging.getLogger(__name__)
-    logger.info("Logistic Regression Model has accuracy of %.3f on test data.", score)
-    logger.info(
-        "Logistic Regression Model has precision of %.3f on test data.", precision
-    )
-    logger.info("Logistic Regression Model has recall of %.3f on test data.", recall)
-    logger.info("Logistic Regression Model has f1_Score of %.3f on test data.", f1)
-    metrics["logistic_regression"] = [score, precision, recall, f1, y_pred]
-
-    y_pred = regressor_random_forest.predict(X_test)
-    score = accuracy_score(y_test, y_pred)
-    precision = precision_score(y_test, y_pred)
-    recall = recall_score(y_test, y_pred)
-    f1 = f1_score(y_test, y_pred)
-    logger = logging.getLogger(__name__)
-    logger.info("Random Forest Model has accuracy of %.3f on test data.", score)
-    logger.info("Random Forest Model has precision of %.3f on test data.", precision)
-    logger.info("Random Forest Model has recall of %.3f on test data.", recall)
-    logger.info("Random Forest Model has f1_Score of %.3f on test data.", f1)
-    metrics["random_forest"] = [score, precision, recall, f1, y_pred]
-
-    y_pred = regressor_xg_boost.predict(X_test)
-    score = accuracy_score(y_test, y_pred)
-    precision = precision_score(y_test, y_pred)
-    recall = recall_score(y_test, y_pred)
-    f1 = f1_score(y_test, y_pred)
-    logger = logging.getLogger(__name__)
-    logger.info("XG Boost Model has accuracy of %.3f on test data.", score)
-    logger.info("XG Boost Model has precision of %.3f on test data.", precision)
-    logger.info("XG Boost Model has recall of %.3f on test data.", recall)
-    logger.info("XG Boost Model has f1_Score of %.3f on test data.", f1)
-    metrics["xg_boost"] = [score, precision, recall, f1, y_pred]
-
-    y_pred = regressor_decision_tree.predict(X_test)
-    
-    score = accuracy_score(y_test, y_pred)
-    precision = precision_score(y_test, y_pred)
-    recall = recall_score(y_test, y_pred)
-    f1 = f1_score(y_test, y_pred)
+    Raises:
+        ValueError: If every model exceeds the latency budget.
+    """
     logger = logging.getLogger(__name__)
-    logger.info("Decision Tree Model has accuracy of %.3f on test data.", score)
-    logger.info("Decision Tree Model has precision of %.3f on test data.", precision)
-    logger.info("Decision Tree Model has recall of %.3f on test data.", recall)
-    logger.info("Decision Tree Model has f1_Score of %.3f on test data.", f1)
-    metrics["decision_tree"] = [score, precision, recall, f1, y_pred]
+    selection = parameters.get("selection", {})
 
-    best_f1_score = 0
-    model = None
-    y_pred = []
+    results = Parallel(
+        n_jobs=parameters.get("evaluation_n_jobs", 1), prefer="threads"
+    )(
+        delayed(evaluate_model)(
+            regressor, X_test, y_test, selection.get("latency_samples", 200)
+        )
+        for regressor in models.values()
+    )
+    results = dict(zip(models, results))
+
+    for name, (scores, _, timings) in results.items():
+        label = MODEL_REGISTRY[name].display_name if name in MODEL_REGISTRY else name
+        for metric, score in zip(
+            ["accuracy", "precision", "recall", "f1_Score"], scores
+        ):
+            logger.info("%s Model has %s of %.3f on test data.", label, metric, score)
+        logger.info(
+            "%s Model was trained in %.2f s, predicts a row in %.3f ms (p50) / "
+            "%.3f ms (p99) and %.0f rows/s in batch.",
+            label,
+            timings["training_time"],
+            timings["latency_p50_ms"],
+            timings["latency_p99_ms"],
+            timings["throughput"],
+        )
 
-    for i in metrics.keys():
-        if metrics[i][3] > best_f1_score:
-            best_f1_score = metrics[i][3]
-            model = i
-            y_pred = metrics[i][-1]
+    model_scores = pd.DataFrame(
+        [
+            {
+                "model": name,
+                **dict(zip(["accuracy", "precision", "recall", "f1"], scores)),
+                **timings,
+            }
+            for name, (scores, _, timings) in results.items()
+        ]
+    )
 
-    for i in metrics.keys():
-        del metrics[i][-1]
+    latency_budget = selection.get("latency_budget_ms")
+    candidates = [
+        name
+        for name, (_, _, timings) in results.items()
+        if latency_budget is None or timings["latency_p99_ms"] <= latency_budget
+    ]
+    if not candidates:
+        raise ValueError(
+            f"No model predicts a row within the latency budget of {latency_budget} ms."
+        )
+    for name in results:
+        if name not in candidates:
+            logger.info("Rejected Model Algorithm %s: over the latency budget.", name)
+
+    if cv_scores:
+        for name, cv_score in cv_scores.items():
+            label = (
+                MODEL_REGISTRY[name].display_name if name in MODEL_REGISTRY else name
+            )
+            logger.info(
+                "%s Model has cross-validated f1_Score of %.3f +/- %.3f.",
+                label,
+                cv_score["mean"][3],
+                cv_score["std"][3],
+            )
+        model = max(candidates, key=lambda name: cv_scores[name]["mean"][3])
+        scores = cv_scores[model]["mean"]
+    else:
+        model = max(candidates, key=lambda name: results[name][0][3])
+        scores = results[model][0]
+    y_pred = results[model][1]
+    regressor = models[model]
 
     logger.info("Selected Model Algorithm: " + model)
 
-    if model == "logistic_regression":
-        regressor = regressor_logistic_regression
-    elif model == "decision_tree":
-        regressor = regressor_decision_tree
-    elif model == "random_forest":
-        regressor = regressor_random_forest
-    elif model == "xg_boost":
-        regressor = regressor_xg_boost
-
-    metrics = {f"value_{i+1}": value for i, value in enumerate(metrics[model])}
+    metrics = {f"value_{i+1}": value for i, value in enumerate(scores)}
+    if cv_scores:
+        metrics.update(
+            {f"value_{i+1}_std": std for i, std in enumerate(cv_scores[model]["std"])}
+        )
+    metrics.update(results[model][2])
 
-    return y_pred, metrics, regressor, regressor, {"model":model}
+    return y_pred, metrics, regressor, regressor, {"model": model}, model_scores
 
 
-def prediction_drift_check(user_df, y_test: pd.Series):
+def prediction_drift_check(user_df, y_test_sketch: Dict, parameters: Dict):
     """
     Checks for prediction drift between the true and predicted values.
 
-    This function runs a data drift analysis between the provided true values (`y_test`)
-    and predicted values (`y_pred`). It generates a drift report using the `Report` class
-    with the `DataDriftPreset` metrics, saves the report as an HTML file, and returns the
-    drift report in JSON format.
+    This function tests the predictions logged for the users (`user_df["Depression"]`)
+    for drift from the sketch of the true test values with
+    `rohith_ai_839.drift.drift_report`, and returns the drift report.
 
     Parameters
     ----------
-    y_test : pd.Series
-        The reference true values (ground truth) to check for prediction drift.
-    y_pred : pd.Series
-        The predicted values to compare against the reference true values.
+    user_df : pd.DataFrame
+        The log of the users' predictions, with the predicted values in "Depression".
+    y_test_sketch : dict
+        The sketch of the reference true values (ground truth).
+    parameters : dict
+        The drift options: "drift_share" and "stattest_threshold".
 
     Returns
     -------
     dict
         A dictionary containing the drift report results in JSON format.
 
-    Side Effects
-    ------------
-    An HTML file named 'evidently_plot.html' is saved to 'data/08_reporting/' containing the visual report.
+    Raises
+    ------
+    Exception
+        If the predictions drift from the true values.
     """
-
-    
-    report = Report(
-        metrics=[
-            DataDriftPreset(),
-        ]
-    )
-
-    
-
-    report.run(
-        reference_data=y_test,
-        current_data=pd.DataFrame(user_df["Depression"]),
+    report = drift_report(
+        y_test_sketch,
+        pd.DataFrame(user_df["Depression"]),
+        drift_share=parameters.get("drift_share", 0.5),
+        stattest_threshold=parameters.get("stattest_threshold"),
     )
 
-    if json.loads(report.json())["metrics"][1]["result"]["drift_by_columns"][
-        "Depression"
-    ]["drift_detected"]:
+    if report["metrics"][1]["result"]["drift_by_columns"]["Depression"][
+        "drift_detected"
+    ]:
         raise Exception("Prediction Variable Drift Detected. Pipeline Failure")
-    else:
-        report.save_html("data/08_reporting/evidently_plot.html")
-        return json.loads(report.json())
-    
+    return report
 
-def plot_and_save(column_name, current_data, reference_data):
-    """
-    Plots and saves the probability density distribution for a specified column.
 
-    This function compares the probability density distribution between the current and
-    reference datasets for a specified column. It creates a line plot for both datasets and saves
-    the plot as a PNG file to a predefined location.
+def distribution_figure(column_name, current_data, reference_data) -> go.Figure:
+    """
+    Plots the probability density distribution of a column in the current and reference
+    data.
 
     Parameters
     ----------
     column_name : str
         The name of the column for which the distribution plot is generated.
-    current_data : pd.DataFrame
-        The current dataset containing columns 'x' (values) and 'y' (probability densities).
-    reference_data : pd.DataFrame
-        The reference dataset containing columns 'x' (values) and 'y' (probability densities).
+    current_data : dict
+        The current distribution, with the values in 'x' and the probability densities
+        in 'y'.
+    reference_data : dict
+        The reference distribution, with the values in 'x' and the probability densities
+        in 'y'.
 
     Returns
     -------
-    None
-        This function does not return any value, but saves the generated plot as a PNG file.
-
-    Side Effects
-    ------------
-    A PNG file named after the column is saved to 'data/08_reporting/' containing the
-    distribution plot for the specified column.
+    go.Figure
+        The distribution plot of the column.
     """
-
-    current_x = current_data["x"]
-    current_y = current_data["y"]
-
-    reference_x = reference_data["x"]
-    reference_y = reference_data["y"]
-
-    # Create the plot
     fig = go.Figure()
 
     # Add trace for current data
     fig.add_trace(
         go.Scatter(
-            x=current_x, y=current_y, mode="lines+markers", name="Current Distribution"
+            x=current_data["x"],
+            y=current_data["y"],
+            mode="lines+markers",
+            name="Current Distribution",
         )
     )
 
     # Add trace for reference data
     fig.add_trace(
         go.Scatter(
-            x=reference_x,
-            y=reference_y,
+            x=reference_data["x"],
+            y=reference_data["y"],
             mode="lines+markers",
             name="Reference Distribution",
         )
@@ -386,24 +1010,129 @@ def plot_and_save(column_name, current_data, reference_data):
         legend=dict(x=0.02, y=0.98),
         template="plotly_dark",
     )
+    return fig
+
+
+def distribution_image_path(column_name) -> str:
+    return "data/08_reporting/{}_distribution.png".format(column_name.replace("/", "_"))
+
+
+def plot_and_save(column_name, current_data, reference_data):
+    """
+    Plots and saves the probability density distribution for a specified column.
+
+    This function compares the probability density distribution between the current and
+    reference datasets for a specified column, see `distribution_figure`, and saves the
+    plot as a PNG file to a predefined location.
+
+    Parameters
+    ----------
+    column_name : str
+        The name of the column for which the distribution plot is generated.
+    current_data : dict
+        The current distribution, with the values in 'x' and the probability densities
+        in 'y'.
+    reference_data : dict
+        The reference distribution, with the values in 'x' and the probability densities
+        in 'y'.
+
+    Returns
+    -------
+    None
+        This function does not return any value, but saves the generated plot as a PNG
+        file.
 
-    # Show the plot
+    Side Effects
+    ------------
+    A PNG file named after the column is saved to 'data/08_reporting/' containing the
+    distribution plot for the specified column.
+    """
     pio.write_image(
-        fig,
-        file="data/08_reporting/{}_distribution.png".format(
-            column_name.replace("/", "_")
-        ),
+        distribution_figure(column_name, current_data, reference_data),
+        file=distribution_image_path(column_name),
+    )
+
+
+def write_image_batch(figures: List[Tuple[str, go.Figure]]) -> None:
+    """Exports figures to PNG files in the current process."""
+    for path, fig in figures:
+        pio.write_image(fig, file=path)
+
+
+def write_images(figures: Dict[str, go.Figure], n_jobs: int = 1) -> None:
+    """
+    Exports figures to PNG files, optionally with a pool of worker processes.
+
+    Plotly already reuses one Kaleido renderer per process for all its exports, so with
+    the default single job every figure goes through the renderer of this process.
+    With more jobs, the figures are split in one batch per worker process, each starting
+    its own renderer (a Chromium instance with Kaleido 0.2): only worth it when the
+    exports outlast that start-up, e.g. for wide feature sets.
+
+    Args:
+        figures: The figures to export, keyed by the path of their PNG file.
+        n_jobs: Number of worker processes, 1 to export in the current process.
+    """
+    items = list(figures.items())
+    n_jobs = max(min(n_jobs, len(items)), 1)
+    if n_jobs == 1:
+        write_image_batch(items)
+        return
+    Parallel(n_jobs=n_jobs)(
+        delayed(write_image_batch)(items[i::n_jobs]) for i in range(n_jobs)
     )
 
 
-def report_plotly(data_drift, pred_drift):
+def drift_dashboard(distributions: Dict[str, Tuple[Dict, Dict]], columns: int = 3):
     """
-    Generates and saves distribution plots for data and prediction drift using Plotly.
+    Combines the distribution plots of every column into a single interactive figure.
+
+    Args:
+        distributions: The current and reference distributions, keyed by column.
+        columns: Number of plots per row.
+
+    Returns:
+        go.Figure: One subplot per column, with the current and reference distributions.
+    """
+    rows = max(-(-len(distributions) // columns), 1)
+    fig = make_subplots(
+        rows=rows, cols=columns, subplot_titles=list(distributions)
+    )
+    for i, (current_data, reference_data) in enumerate(distributions.values()):
+        for name, data, color in [
+            ("Current Distribution", current_data, "#636efa"),
+            ("Reference Distribution", reference_data, "#ef553b"),
+        ]:
+            fig.add_trace(
+                go.Scatter(
+                    x=data["x"],
+                    y=data["y"],
+                    mode="lines+markers",
+                    name=name,
+                    legendgroup=name,
+                    showlegend=i == 0,
+                    line=dict(color=color),
+                ),
+                row=i // columns + 1,
+                col=i % columns + 1,
+            )
+    fig.update_layout(
+        title="Data and prediction drift distributions",
+        height=300 * rows,
+        template="plotly_dark",
+    )
+    return fig
+
+
+def report_plotly(data_drift, pred_drift, parameters: Dict):
+    """
+    Generates distribution plots for data and prediction drift using Plotly.
 
     This function processes the drift reports from the data drift and prediction drift analyses,
-    extracts the small distribution data for each column, and generates distribution plots using
-    the `plot_and_save` function. It handles both data drift and prediction drift reports, saving
-    the resulting plots as PNG files.
+    extracts the small distribution data for each column, and combines the distribution
+    plots of all the columns into a single interactive dashboard. When "png" is set, the
+    plot of each column is also exported as a PNG file, the figures being built first
+    and exported together, see `write_images`.
 
     Parameters
     ----------
@@ -413,25 +1142,35 @@ def report_plotly(data_drift, pred_drift):
     pred_drift : dict
         A dictionary containing the prediction drift report, including metrics and drift results
         by columns.
+    parameters : dict
+        The report options: "png" and "n_jobs".
 
     Returns
     -------
-    None
-        This function does not return any value, but saves the generated distribution plots
-        as PNG files for each column.
+    tuple
+        The dashboard figure twice, to be saved as Plotly JSON and as HTML.
 
     Side Effects
     ------------
-    PNG files are saved to 'data/08_reporting/' for each column's distribution plot based
-    on the drift reports.
-    """
-    data_drift_by_columns = data_drift["metrics"][1]["result"]["drift_by_columns"]
-    pred_drift_by_columns = pred_drift["metrics"][1]["result"]["drift_by_columns"]
-    for column, data in data_drift_by_columns.items():
-        current_distribution = data["current"]["small_distribution"]
-        reference_distribution = data["reference"]["small_distribution"]
-        plot_and_save(column, current_distribution, reference_distribution)
-    for column, data in pred_drift_by_columns.items():
-        current_distribution = data["current"]["small_distribution"]
-        reference_distribution = data["reference"]["small_distribution"]
-        plot_and_save(column, current_distribution, reference_distribution)
+    With "png", PNG files are saved to 'data/08_reporting/' for each column's
+    distribution plot based on the drift reports.
+    """
+    distributions = {}
+    for report in (data_drift, pred_drift):
+        for column, data in report["metrics"][1]["result"]["drift_by_columns"].items():
+            distributions[column] = (
+                data["current"]["small_distribution"],
+                data["reference"]["small_distribution"],
+            )
+
+    if parameters.get("png", True):
+        write_images(
+            {
+                distribution_image_path(column): distribution_figure(column, *data)
+                for column, data in distributions.items()
+            },
+            n_jobs=parameters.get("n_jobs", 1),
+        )
+
+    dashboard = drift_dashboard(distributions)
+    return dashboard, dashboard
@@ -1,15 +1,16 @@
+from functools import partial, update_wrapper
+
 from kedro.pipeline import Pipeline, node, pipeline
 
 from .nodes import (
+    MODEL_REGISTRY,
+    cross_validate_models,
     evaluate_all_models,
-    prediction_drift_check,
     quality_drift_check,
     report_plotly,
+    search_hyperparameters,
+    sketch_reference_data,
     split_data,
-    train_decision_tree,
-    train_logistic_regression,
-    train_random_forest,
-    train_xg_boost,
 )
 
 
@@ -19,56 +20,102 @@ def create_pipeline(**kwargs) -> Pipeline:
             node(
                 func=split_data,
                 inputs=["model_input_dataset", "params:model_options"],
-                outputs=["X_train", "X_test", "y_train", "y_test"],
+                outputs=[
+                    "X_train",
+                    "X_test",
+                    "y_train",
+                    "y_test",
+                    "X_calib",
+                    "y_calib",
+                    "X_train_array",
+                ],
                 name="split_data_node",
             ),
             node(
-                func=train_logistic_regression,
-                inputs=["X_train", "y_train"],
-                outputs=["regressor_logistic_regression", "conformal_logistic_regression"],
-                name="train_model_node_logistic_regression",
-            ),
-            node(
-                func=train_random_forest,
-                inputs=["X_train", "y_train"],
-                outputs=["regressor_random_forest", "conformal_random_forest"],
-                name="train_model_node_random_forest",
-            ),
-            node(
-                func=train_xg_boost,
-                inputs=["X_train", "y_train"],
-                outputs=["regressor_xg_boost", "conformal_xg_boost"],
-                name="train_model_node_xg_boost",
+                func=sketch_reference_data,
+                inputs=["X_train", "y_test"],
+                outputs=["X_train_sketch", "y_test_sketch"],
+                name="sketch_reference_data",
             ),
+            *[
+                node(
+                    func=update_wrapper(
+                        partial(search_hyperparameters, model=name),
+                        search_hyperparameters,
+                    ),
+                    inputs=[
+                        "X_train_array",
+                        "y_train",
+                        "params:hyperparameter_search",
+                        "params:training_options",
+                    ],
+                    outputs=[f"{name}_hyperparameters", f"{name}_search_trials"],
+                    name=f"search_hyperparameters_node_{name}",
+                )
+                for name in MODEL_REGISTRY
+            ],
+            *[
+                node(
+                    func=model.train,
+                    inputs=[
+                        "X_train_array",
+                        "y_train",
+                        "X_calib",
+                        "y_calib",
+                        f"{name}_hyperparameters",
+                        *([f"regressor_{name}_previous"] if model.warm_start else []),
+                        "params:training_options",
+                    ],
+                    outputs=[f"regressor_{name}", f"conformal_{name}"],
+                    name=f"train_model_node_{name}",
+                )
+                for name, model in MODEL_REGISTRY.items()
+            ],
             node(
-                func=train_decision_tree,
-                inputs=["X_train", "y_train"],
-                outputs=["regressor_decision_tree", "conformal_decision_tree"],
-                name="train_model_node_decision_tree",
+                func=cross_validate_models,
+                inputs={
+                    "X_train": "X_train_array",
+                    "y_train": "y_train",
+                    "parameters": "params:training_options",
+                    **{name: f"{name}_hyperparameters" for name in MODEL_REGISTRY},
+                },
+                outputs="cv_scores",
+                name="cross_validate_models",
             ),
             node(
                 func=evaluate_all_models,
-                inputs=[
-                    "regressor_logistic_regression",
-                    "regressor_decision_tree",
-                    "regressor_xg_boost",
-                    "regressor_random_forest",
-                    "X_test",
-                    "y_test"
+                inputs={
+                    "X_test": "X_test",
+                    "y_test": "y_test",
+                    "parameters": "params:training_options",
+                    "cv_scores": "cv_scores",
+                    **{name: f"regressor_{name}" for name in MODEL_REGISTRY},
+                },
+                outputs=[
+                    "y_pred",
+                    "metrics",
+                    "sklearn_model",
+                    "regressor",
+                    "model_selection_name",
+                    "model_scores",
                 ],
-                outputs=["y_pred", "metrics", "sklearn_model", "regressor", "model_selection_name"],
                 name="evaluate_all_models",
             ),
             node(
                 func=quality_drift_check,
-                inputs=["X_train", "X_test"],
+                inputs=[
+                    "X_train_sketch",
+                    "X_test",
+                    "params:drift_options",
+                    "X_train_lazy",
+                ],
                 outputs="data_drift",
                 name="data_quality_check",
             ),
             node(
                 func=report_plotly,
-                inputs=["data_drift", "pred_drift"],
-                outputs=None,
+                inputs=["data_drift", "pred_drift", "params:report_options"],
+                outputs=["data_drift_plotly", "drift_dashboard"],
                 name="report_plotly",
             ),
         ]
@@ -77,7 +124,11 @@ def create_pipeline(**kwargs) -> Pipeline:
 
 """node(
                 func=prediction_drift_check,
-                inputs=["user_accounts_predictions_log", "y_test"],
+                inputs=[
+                    "user_accounts_predictions_log",
+                    "y_test_sketch",
+                    "params:drift_options",
+                ],
                 outputs="pred_drift",
                 name="prediction_drift_check",
             )"""
\ No newline at end of file
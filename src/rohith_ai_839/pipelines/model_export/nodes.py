@@ -0,0 +1,148 @@
+import copy
+import logging
+import time
+from typing import Dict, Tuple
+
+import numpy as np
+import onnxruntime as ort
+import pandas as pd
+from onnxmltools.convert.xgboost.operator_converters.XGBoost import convert_xgboost
+from skl2onnx import convert_sklearn, update_registered_converter
+from skl2onnx.common.data_types import FloatTensorType
+from skl2onnx.common.shape_calculator import calculate_linear_classifier_output_shapes
+from xgboost import XGBClassifier
+
+from rohith_ai_839.pipelines.data_science.nodes import MODEL_REGISTRY, to_float32_frame
+
+logger = logging.getLogger(__name__)
+
+# skl2onnx only knows the scikit-learn estimators, the XGBoost converter comes from
+# onnxmltools
+update_registered_converter(
+    XGBClassifier,
+    "XGBoostXGBClassifier",
+    calculate_linear_classifier_output_shapes,
+    convert_xgboost,
+    options={"nocl": [True, False], "zipmap": [True, False, "columns"]},
+)
+
+
+def convert_to_onnx(model, n_features: int, parameters: Dict):
+    """Converts a trained classifier to an ONNX graph.
+
+    The graph takes a float32 "input" matrix and returns the predicted "label" and the
+    class "probabilities" as plain tensors (no ZipMap), like `predict` and
+    `predict_proba`. The input has no column names: the XGBoost converter only reads
+    the default "f0", "f1", ... feature names, so a copy of the booster without the
+    names of its features is converted.
+
+    Args:
+        model: Trained scikit-learn or XGBoost classifier.
+        n_features: Number of input features.
+        parameters: The `onnx_export` parameters, with the "opset" and "ml_opset".
+
+    Returns:
+        onnx.ModelProto: The converted model.
+    """
+    if isinstance(model, XGBClassifier):
+        model = copy.deepcopy(model)
+        model.get_booster().feature_names = None
+    return convert_sklearn(
+        model,
+        initial_types=[("input", FloatTensorType([None, n_features]))],
+        options={id(model): {"zipmap": False}},
+        target_opset={"": parameters["opset"], "ai.onnx.ml": parameters["ml_opset"]},
+    )
+
+
+def single_row_latency(predict, X, latency_samples: int) -> float:
+    """Returns the median latency in ms of single-row predictions of X."""
+    latencies = []
+    for i in range(min(latency_samples, len(X))):
+        row = X[i : i + 1]
+        start = time.perf_counter()
+        predict(row)
+        latencies.append(time.perf_counter() - start)
+    return float(np.median(latencies) * 1000)
+
+
+def export_onnx(
+    sklearn_model, model_selection_name: Dict, X_test: pd.DataFrame, parameters: Dict
+) -> Tuple[Dict, Dict]:
+    """Exports the selected model to ONNX after checking it predicts like the original.
+
+    The ONNX model is run with onnxruntime on the test set: its labels must agree with
+    `predict` on at least "min_label_agreement" of the rows, and its probabilities must
+    stay within "probability_atol" of `predict_proba`. Models that cannot be converted
+    (the Histogram Gradient Boosting converter of skl2onnx is broken for recent
+    scikit-learn versions) or that fail the parity check are not exported, the app then
+    keeps serving the scikit-learn model.
+
+    Args:
+        sklearn_model: The model selected by `evaluate_all_models`.
+        model_selection_name: Dict with the registry key of the model under "model".
+        X_test: Test dataset features.
+        parameters: The `onnx_export` parameters.
+
+    Returns:
+        A dict mapping the model name to its ONNX model, empty when the model is not
+        exported, and the parity metrics: "exported" (0 or 1), "label_agreement",
+        "max_probability_diff" and the single-row "onnx_latency_p50_ms" and
+        "sklearn_latency_p50_ms".
+    """
+    name = model_selection_name["model"]
+    label = MODEL_REGISTRY[name].display_name if name in MODEL_REGISTRY else name
+    X = to_float32_frame(X_test)
+    # The ONNX graph takes a plain matrix, the model the named features it was fit on
+    X_onnx = X.to_numpy()
+
+    try:
+        onnx_model = convert_to_onnx(sklearn_model, X.shape[1], parameters)
+    except Exception as e:
+        logger.warning("%s Model cannot be exported to ONNX: %s", label, e)
+        return {}, {"exported": 0.0}
+
+    session = ort.InferenceSession(
+        onnx_model.SerializeToString(), providers=["CPUExecutionProvider"]
+    )
+    onnx_label, onnx_proba = session.run(None, {"input": X_onnx})
+    label_agreement = float(np.mean(onnx_label == sklearn_model.predict(X)))
+    max_probability_diff = float(
+        np.abs(onnx_proba - sklearn_model.predict_proba(X)).max()
+    )
+
+    latency_samples = parameters.get("latency_samples", 200)
+    parity = {
+        "exported": 0.0,
+        "label_agreement": label_agreement,
+        "max_probability_diff": max_probability_diff,
+        "onnx_latency_p50_ms": single_row_latency(
+            lambda row: session.run(None, {"input": row}), X_onnx, latency_samples
+        ),
+        "sklearn_latency_p50_ms": single_row_latency(
+            sklearn_model.predict, X, latency_samples
+        ),
+    }
+
+    if (
+        label_agreement < parameters["min_label_agreement"]
+        or max_probability_diff > parameters["probability_atol"]
+    ):
+        logger.warning(
+            "%s Model is not exported to ONNX: %.4f of the labels agree and the "
+            "probabilities differ by up to %.2e.",
+            label,
+            label_agreement,
+            max_probability_diff,
+        )
+        return {}, parity
+
+    logger.info(
+        "%s Model exported to ONNX, it predicts a row in %.3f ms (p50) against %.3f ms "
+        "for scikit-learn.",
+        label,
+        parity["onnx_latency_p50_ms"],
+        parity["sklearn_latency_p50_ms"],
+    )
+    parity["exported"] = 1.0
+    return {name: onnx_model}, parity
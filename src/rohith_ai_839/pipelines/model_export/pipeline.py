@@ -0,0 +1,21 @@
+from kedro.pipeline import Pipeline, node, pipeline
+
+from .nodes import export_onnx
+
+
+def create_pipeline(**kwargs) -> Pipeline:
+    return pipeline(
+        [
+            node(
+                func=export_onnx,
+                inputs=[
+                    "sklearn_model",
+                    "model_selection_name",
+                    "X_test",
+                    "params:onnx_export",
+                ],
+                outputs=["onnx_model", "onnx_parity"],
+                name="export_onnx",
+            ),
+        ]
+    )
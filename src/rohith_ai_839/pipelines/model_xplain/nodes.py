@@ -85,16 +85,9 @@ def xplain_model_prediction(sklearn_model, user_df, userid):
     
     return features_to_predicted_label, features_away_predicted_label
 
-def prediction_confidence(user_df, userid, model_selection_name, conformal_logistic_regression, conformal_random_forest, conformal_xg_boost, conformal_decision_tree):
-    model = model_selection_name["model"]
-    if model == "logistic_regression":
-        regressor = conformal_logistic_regression
-    elif model == "decision_tree":
-        regressor = conformal_decision_tree
-    elif model == "random_forest":
-        regressor = conformal_random_forest
-    elif model == "xg_boost":
-        regressor = conformal_xg_boost
+def prediction_confidence(user_df, userid, model_selection_name, **conformal_models):
+    # Conformal wrappers of every candidate model, keyed by their name in MODEL_REGISTRY
+    regressor = conformal_models[model_selection_name["model"]]
 
     x_pred = user_df.loc[user_df['id']==userid].drop(columns=["id", "Name", "City", "Depression"])
 
@@ -1,5 +1,7 @@
 from kedro.pipeline import Pipeline, node, pipeline
 
+from rohith_ai_839.pipelines.data_science.nodes import MODEL_REGISTRY
+
 from .nodes import xplain_model_prediction, prediction_confidence
 
 
@@ -14,10 +16,12 @@ def create_pipeline(**kwargs) -> Pipeline:
             ),
             node(
                 func=prediction_confidence,
-                inputs=["user_accounts_predictions_log", "params:userid", "model_selection_name", "conformal_logistic_regression",
-                    "conformal_decision_tree",
-                    "conformal_xg_boost",
-                    "conformal_random_forest"],
+                inputs={
+                    "user_df": "user_accounts_predictions_log",
+                    "userid": "params:userid",
+                    "model_selection_name": "model_selection_name",
+                    **{name: f"conformal_{name}" for name in MODEL_REGISTRY},
+                },
                 outputs="prediction_confidence",
                 name="prediction_confidence",
             )
@@ -0,0 +1,207 @@
+"""Kedro runners that skip the nodes whose inputs did not change since their last run.
+
+Nodes tagged ``cacheable`` are fingerprinted with a content hash of their input files,
+the values of their parameters and the source code of the package of their function,
+so that a change to any helper they call is noticed as well. When a run finds
+the same fingerprint as the one recorded by the previous run, and the outputs of the
+node are still on disk, the node is skipped and downstream nodes load its last saved
+outputs.
+
+Use it from the command line with::
+
+    kedro run --runner=rohith_ai_839.runner.CachingSequentialRunner
+    kedro run --runner=rohith_ai_839.runner.CachingThreadRunner
+"""
+
+import functools
+import hashlib
+import importlib.util
+import inspect
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from kedro.io.core import get_filepath_str
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+from kedro.runner import SequentialRunner, ThreadRunner
+
+CACHEABLE_TAG = "cacheable"
+FINGERPRINTS_DATASET = "node_fingerprints"
+
+logger = logging.getLogger(__name__)
+
+
+def dataset_fingerprint(catalog, name: str) -> Optional[str]:
+    """
+    Hashes the content of a dataset without loading it.
+
+    Parameters are hashed from their values, file based datasets from the bytes of the
+    file that would be loaded (the latest version for versioned datasets). The file is
+    the load path of the dataset, on the filesystem the dataset reads from.
+
+    Args:
+        catalog: The catalog the dataset is registered in.
+        name (str): The name of the dataset.
+
+    Returns:
+        Optional[str]: The hex digest, or None when the dataset is not a single file on
+            disk (memory datasets, directories, files not written yet).
+    """
+    digest = hashlib.blake2b()
+
+    if name == "parameters" or name.startswith("params:"):
+        digest.update(
+            json.dumps(catalog.load(name), sort_keys=True, default=str).encode()
+        )
+        return digest.hexdigest()
+
+    # `exists` also materialises the datasets matching a dataset factory
+    if not catalog.exists(name):
+        return None
+    dataset = getattr(catalog.datasets, re.sub(r"\W+", "__", name), None)
+    fs = getattr(dataset, "_fs", None)
+    if fs is None or not hasattr(dataset, "_get_load_path"):
+        return None
+    path = get_filepath_str(dataset._get_load_path(), dataset._protocol)
+    if not fs.isfile(path):
+        return None
+
+    with fs.open(path, "rb") as f:
+        for block in iter(lambda: f.read(2**20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def code_fingerprint(module: str) -> str:
+    """
+    Hashes the source files of the top-level package of a module.
+
+    The whole package is hashed, not only the function of a node: the helpers it calls
+    live in the same or in other modules of the package.
+
+    Args:
+        module (str): The name of the module, e.g. ``node.func.__module__``.
+
+    Returns:
+        str: The hex digest.
+    """
+    digest = hashlib.blake2b()
+    spec = importlib.util.find_spec(module.split(".")[0])
+    if spec.submodule_search_locations:
+        root = Path(next(iter(spec.submodule_search_locations)))
+        files = sorted(root.rglob("*.py"))
+    else:
+        root = Path(spec.origin).parent
+        files = [Path(spec.origin)]
+    for file in files:
+        digest.update(file.relative_to(root).as_posix().encode())
+        digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+def node_fingerprint(node: Node, catalog) -> Optional[str]:
+    """
+    Hashes the code of a node together with the content of all its inputs.
+
+    Args:
+        node (Node): The node to fingerprint.
+        catalog: The catalog its inputs are registered in.
+
+    Returns:
+        Optional[str]: The hex digest, or None when one of the inputs cannot be hashed.
+    """
+    digest = hashlib.blake2b()
+    func = inspect.unwrap(node.func)
+    try:
+        digest.update(code_fingerprint(func.__module__).encode())
+    except (AttributeError, OSError, TypeError, ValueError):
+        return None
+    digest.update(getattr(func, "__qualname__", repr(func)).encode())
+
+    for name in sorted(node.inputs):
+        fingerprint = dataset_fingerprint(catalog, name)
+        if fingerprint is None:
+            return None
+        digest.update(name.encode())
+        digest.update(fingerprint.encode())
+    return digest.hexdigest()
+
+
+class CachingRunnerMixin:
+    """
+    Adds fingerprint based skipping of the ``cacheable`` nodes to a Kedro runner.
+
+    The fingerprints of the previous runs are stored in the ``node_fingerprints``
+    dataset, which must be registered in the catalog.
+    """
+
+    def run(
+        self,
+        pipeline: Pipeline,
+        catalog,
+        hook_manager=None,
+        session_id: str = None,
+    ) -> Dict[str, Any]:
+        fingerprints = (
+            catalog.load(FINGERPRINTS_DATASET)
+            if catalog.exists(FINGERPRINTS_DATASET)
+            else {}
+        )
+
+        # Nodes are visited in topological order: a node is only skipped when none of
+        # its inputs is produced by a node that runs
+        skipped = set()
+        changed = set()
+        for node in pipeline.nodes:
+            if (
+                CACHEABLE_TAG in node.tags
+                and not changed.intersection(node.inputs)
+                and all(catalog.exists(output) for output in node.outputs)
+            ):
+                fingerprint = node_fingerprint(node, catalog)
+                # Nodes with an input that cannot be hashed are never skipped
+                if (
+                    fingerprint is not None
+                    and fingerprints.get(node.name) == fingerprint
+                ):
+                    logger.info(
+                        "Skipping node %s, its inputs did not change.", node.name
+                    )
+                    skipped.add(node)
+                    continue
+            changed.update(node.outputs)
+
+        run_output = super().run(
+            Pipeline([node for node in pipeline.nodes if node not in skipped]),
+            catalog,
+            hook_manager,
+            session_id,
+        )
+
+        # Recorded after the run, once the outputs read by incremental nodes are saved
+        for node in pipeline.nodes:
+            if CACHEABLE_TAG in node.tags and node not in skipped:
+                fingerprint = node_fingerprint(node, catalog)
+                if fingerprint is None:
+                    fingerprints.pop(node.name, None)
+                else:
+                    fingerprints[node.name] = fingerprint
+        catalog.save(FINGERPRINTS_DATASET, fingerprints)
+
+        return run_output
+
+
+class CachingSequentialRunner(CachingRunnerMixin, SequentialRunner):
+    """A ``SequentialRunner`` skipping the ``cacheable`` nodes with unchanged inputs."""
+
+
+class CachingThreadRunner(CachingRunnerMixin, ThreadRunner):
+    """A ``ThreadRunner`` skipping the ``cacheable`` nodes whose inputs did not change.
+
+    Independent nodes, such as the training nodes of the data_science pipeline, run
+    concurrently; their thread budgets are set in ``training_options``.
+    """
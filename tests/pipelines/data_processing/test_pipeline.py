@@ -1,7 +1,24 @@
+import json
+import subprocess
+import sys
+
+import numpy as np
 import pandas as pd
 import pytest
 from evidently.metrics import *
 from evidently.tests import *
+from sklearn.preprocessing import LabelEncoder
+
+from benchmarks.data_processing import USERS_COLUMNS, compare, make_survey_frame
+from rohith_ai_839.datasets import ChunkedCSVDataset
+from rohith_ai_839.pipelines.data_processing import nodes
+from rohith_ai_839.pipelines.data_processing.nodes import (
+    preprocess_dataset,
+    preprocess_dataset_chunks,
+    preprocess_single_record,
+    preprocess_user_predictions_log,
+    update_user_predictions_log,
+)
 
 # Data Quality Checks
 
@@ -18,3 +35,224 @@ def test_missing_values(dummy_data):
             if j:
                 var = True
     assert not (var)
+
+
+# Preprocessing
+
+
+@pytest.fixture
+def real_dataset():
+    dataset = pd.read_csv("data/01_raw/depression_real.csv")
+    dataset.insert(0, "id", range(len(dataset)))
+    dataset["Depression"] = (dataset["Depression"] == "Yes").astype(float)
+    # Keep at most 4 depressed people in a few cities so the city filter bites
+    depressed = dataset[dataset["Depression"] == 1.0]
+    sparse = depressed[depressed["City"].isin(dataset["City"].unique()[:3])]
+    drop_index = sparse[sparse.groupby("City").cumcount() >= 4].index
+    return dataset.drop(drop_index).reset_index(drop=True)
+
+
+def legacy_city_filter(dataset):
+    dataset = dataset.drop(["id"], axis=1)
+    for city in dataset["City"].unique():
+        num_depressed_people = dataset[
+            (dataset["City"] == city) & (dataset["Depression"] == 1.0)
+        ].count()[0]
+        if num_depressed_people < 5:
+            dataset = dataset[dataset["City"] != city]
+    return dataset
+
+
+def legacy_preprocess_dataset(dataset):
+    dataset = legacy_city_filter(dataset)
+    for col, top, other in [
+        ("Profession", slice(1, 35), "Other"),
+        ("Sleep Duration", slice(0, 4), "1-8"),
+        ("Dietary Habits", slice(0, 3), "Moderate"),
+        ("Degree", slice(0, 27), "Other"),
+    ]:
+        kept = dataset[col].value_counts()[top].index
+        dataset[col] = np.where(dataset[col].isin(kept), dataset[col], other)
+    dataset = dataset.fillna(0)
+    for col in dataset.columns[dataset.dtypes == "object"]:
+        dataset[col] = LabelEncoder().fit_transform(dataset[col])
+    return dataset.rename(
+        columns={"Have you ever had suicidal thoughts ?": "suicidal_thoughts"}
+    )
+
+
+def test_city_filter_matches_legacy_loop(real_dataset):
+    expected = legacy_preprocess_dataset(real_dataset)
+    result, _ = preprocess_dataset(real_dataset)
+
+    assert len(expected) < len(real_dataset)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_survey_inputs_encoded_like_training(real_dataset):
+    model_input, preprocessor = preprocess_dataset(real_dataset)
+    survey_inputs_log = real_dataset.sample(50, random_state=0)
+    survey_inputs_log["Depression"] = float("nan")
+
+    result = preprocess_user_predictions_log(survey_inputs_log, preprocessor)
+
+    expected = model_input.loc[result.index].drop(columns=["Depression"])
+    pd.testing.assert_frame_equal(result.drop(columns=["id", "Depression"]), expected)
+
+
+def test_chunked_preprocessing_matches_in_memory(real_dataset, tmp_path):
+    filepath = tmp_path / "dataset.csv"
+    real_dataset.to_csv(filepath, index=False)
+    dataset_chunks = ChunkedCSVDataset(filepath=str(filepath)).load()
+    expected, expected_preprocessor = preprocess_dataset(pd.read_csv(filepath))
+
+    result, preprocessor = preprocess_dataset_chunks(
+        dataset_chunks, {"chunksize": 300, "n_jobs": 2, "prefer": "threads"}
+    )
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert preprocessor["cities"] == expected_preprocessor["cities"]
+    assert preprocessor["vocabularies"] == expected_preprocessor["vocabularies"]
+
+
+def test_tied_categories_are_ordered_like_value_counts(real_dataset, tmp_path):
+    # 60 professions and 40 degrees with (almost) the same counts, first seen in
+    # reverse alphabetical order
+    names = [f"Value {i:02d}" for i in range(60)][::-1]
+    real_dataset["Profession"] = [names[i % 60] for i in range(len(real_dataset))]
+    real_dataset["Degree"] = [names[i * 7 % 40] for i in range(len(real_dataset))]
+    filepath = tmp_path / "dataset.csv"
+    real_dataset.to_csv(filepath, index=False)
+    expected = legacy_city_filter(real_dataset)
+
+    _, preprocessor = preprocess_dataset(real_dataset)
+    _, chunked_preprocessor = preprocess_dataset_chunks(
+        ChunkedCSVDataset(filepath=str(filepath)).load(),
+        {"chunksize": 300, "n_jobs": 1, "prefer": "threads"},
+    )
+
+    for col, (top, _) in nodes.CATEGORY_GROUPS.items():
+        vocabulary = expected[col].value_counts()[top].index.tolist()
+        assert preprocessor["vocabularies"][col] == vocabulary
+        assert chunked_preprocessor["vocabularies"][col] == vocabulary
+
+
+def test_preprocessed_dataset_uses_compact_dtypes(real_dataset):
+    result, preprocessor = preprocess_dataset(real_dataset)
+
+    assert result["Academic Pressure"].dtype == "int8"
+    assert result["CGPA"].dtype == "float32"
+    assert result["Profession"].dtype == preprocessor["dtypes"]["Profession"]
+    itemsizes = result.drop(columns=["Depression"]).dtypes.map(lambda d: d.itemsize)
+    assert (itemsizes <= 4).all()
+
+
+def test_incremental_log_only_preprocesses_changed_rows(real_dataset, mocker):
+    _, preprocessor = preprocess_dataset(real_dataset)
+    survey_inputs_log = real_dataset.head(100).copy()
+    parameters = {"incremental": True}
+    log, fingerprints = update_user_predictions_log(
+        survey_inputs_log, preprocessor, pd.DataFrame(), pd.DataFrame(), parameters
+    )
+
+    survey_inputs_log.loc[3, "Profession"] = "Doctor"
+    survey_inputs_log = pd.concat([survey_inputs_log, real_dataset.iloc[[200]]])
+    spy = mocker.spy(nodes, "preprocess_user_predictions_log")
+    result, _ = update_user_predictions_log(
+        survey_inputs_log, preprocessor, log, fingerprints, parameters
+    )
+
+    assert len(spy.call_args.args[0]) == 2
+    expected = preprocess_user_predictions_log(survey_inputs_log, preprocessor)
+    pd.testing.assert_frame_equal(
+        result.sort_values("id", ignore_index=True),
+        expected.sort_values("id", ignore_index=True),
+    )
+
+
+@pytest.mark.parametrize(
+    "previous_log",
+    [pd.DataFrame(), pd.DataFrame({"id": []}), pd.DataFrame({"Profession": [1, 2]})],
+)
+def test_incremental_log_is_rebuilt_without_a_previous_log(real_dataset, previous_log):
+    _, preprocessor = preprocess_dataset(real_dataset)
+    survey_inputs_log = real_dataset.head(100)
+    parameters = {"incremental": True}
+    _, fingerprints = update_user_predictions_log(
+        survey_inputs_log, preprocessor, pd.DataFrame(), pd.DataFrame(), parameters
+    )
+
+    result, _ = update_user_predictions_log(
+        survey_inputs_log, preprocessor, previous_log, fingerprints, parameters
+    )
+
+    expected = preprocess_user_predictions_log(survey_inputs_log, preprocessor)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_single_record_matches_batch_preprocessing(real_dataset):
+    _, preprocessor = preprocess_dataset(real_dataset)
+    survey_inputs_log = real_dataset.head(50)
+    expected = preprocess_user_predictions_log(survey_inputs_log, preprocessor)
+    features = expected.columns.drop(["id", "Name", "City", "Depression"]).tolist()
+
+    for index, row in expected.iterrows():
+        record = survey_inputs_log.loc[index].to_dict()
+        result = preprocess_single_record(record, preprocessor, features)
+        np.testing.assert_allclose(
+            result, row[features].to_numpy(dtype=float), rtol=1e-6
+        )
+
+    with pytest.raises(ValueError):
+        preprocess_single_record({"City": "Atlantis"}, preprocessor, features)
+
+
+def test_benchmark_survey_frames_can_be_preprocessed():
+    dataset = make_survey_frame(2000)
+
+    result, _ = preprocess_dataset(dataset)
+
+    assert dataset.columns.tolist() == USERS_COLUMNS
+    assert len(result) > 0
+
+
+def test_benchmark_compare_reports_regressions_beyond_the_tolerance():
+    baseline = {"preprocess_dataset[1000]": {"wall_time": 1.0, "peak_mib": 10.0}}
+    results = {
+        "preprocess_dataset[1000]": {"wall_time": 1.1, "peak_mib": 13.0},
+        # Benchmarks missing from the baseline are not compared
+        "preprocess_dataset[5000]": {"wall_time": 5.0, "peak_mib": 50.0},
+    }
+
+    assert compare(results, baseline, 0.2) == [
+        "preprocess_dataset[1000] peak_mib: 13.000 vs 10.000"
+    ]
+    assert compare(results, baseline, 0.5) == []
+
+
+def test_benchmark_saves_and_compares_its_results(tmp_path):
+    script = [sys.executable, "benchmarks/data_processing.py", "--rows", "500"]
+    saved = tmp_path / "baseline.json"
+    subprocess.run(script + ["--repeat", "1", "--save", str(saved)], check=True)
+
+    results = json.loads(saved.read_text())
+    assert set(results) == {
+        "preprocess_dataset[500]",
+        "preprocess_user_predictions_log[500]",
+    }
+    for result in results.values():
+        assert set(result) == {"wall_time", "peak_mib"}
+        assert all(value > 0 for value in result.values())
+
+    # The script fails when a measure exceeds the baseline by more than the tolerance
+    for scale, returncode in [(1000, 0), (0.001, 1)]:
+        baseline = tmp_path / f"baseline_{scale}.json"
+        scaled = {
+            key: {metric: value * scale for metric, value in result.items()}
+            for key, result in results.items()
+        }
+        baseline.write_text(json.dumps(scaled))
+        process = subprocess.run(
+            script + ["--repeat", "1", "--compare", str(baseline)], capture_output=True
+        )
+        assert process.returncode == returncode
@@ -1,12 +1,42 @@
 import json
+import time
 
+import numpy as np
 import pandas as pd
 import pytest
 from evidently.metric_preset import DataDriftPreset
 from evidently.metrics import *
 from evidently.report import Report
 from evidently.tests import *
-from sklearn.model_selection import train_test_split
+from kedro_datasets.plotly import HTMLDataset
+from sklearn.datasets import make_classification
+from sklearn.dummy import DummyClassifier
+from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
+from sklearn.model_selection import StratifiedKFold, cross_val_score, train_test_split
+from sklearn.tree import DecisionTreeClassifier
+
+from rohith_ai_839.datasets import NumpyDataset
+from rohith_ai_839.pipelines.data_science import nodes as data_science_nodes
+from rohith_ai_839.pipelines.data_science.nodes import (
+    MODEL_REGISTRY,
+    binary_classification_metrics,
+    cross_validate_models,
+    evaluate_all_models,
+    evaluate_model,
+    make_estimator,
+    prediction_drift_check,
+    quality_drift_check,
+    report_plotly,
+    search_hyperparameters,
+    sketch_reference_data,
+    split_data,
+    train_decision_tree,
+    train_hist_gradient_boosting,
+    train_logistic_regression,
+    train_random_forest,
+    train_xg_boost,
+)
+from rohith_ai_839.pipelines.data_science.pipeline import create_pipeline
 
 
 @pytest.fixture
@@ -52,3 +82,382 @@ def test_split_data(dummy_data, dummy_parameters):
     assert not (
         report_json["metrics"][1]["result"]["drift_by_columns"]["X_3"]["drift_detected"]
     )
+
+
+@pytest.fixture
+def classification_data():
+    X, y = make_classification(n_samples=300, n_features=5, random_state=0)
+    return pd.DataFrame(X, columns=[f"X_{i}" for i in range(5)]), pd.Series(y)
+
+
+@pytest.fixture
+def splits(classification_data):
+    """Training and calibration data of the train nodes."""
+    X, y = classification_data
+    return X[:200], y[:200], X[200:], y[200:]
+
+
+@pytest.fixture
+def survey_features():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {"Age": rng.normal(40, 10, 600), "Degree": rng.integers(0, 4, 600)}
+    )
+
+
+def test_training_uses_thread_budgets(splits):
+    parameters = {"n_jobs": {"random_forest": 2}}
+
+    random_forest, conformal = train_random_forest(*splits, {}, None, parameters)
+    xg_boost, _ = train_xg_boost(*splits, {}, None, parameters)
+
+    assert random_forest.n_jobs == 2
+    assert conformal.estimator.n_jobs == 2
+    assert xg_boost.n_jobs == 1
+
+
+def test_conformal_wrapper_reuses_the_fitted_model(splits, mocker):
+    fit = mocker.spy(DecisionTreeClassifier, "fit")
+
+    regressor, conformal = train_decision_tree(*splits, {}, {})
+
+    assert fit.call_count == 1
+    assert conformal.estimator_.single_estimator_ is regressor
+    X_calib = splits[2]
+    _, prediction_sets = conformal.predict(X_calib, alpha=0.2)
+    assert prediction_sets.shape == (len(X_calib), 2, 1)
+
+
+def test_confusion_matrix_metrics_match_sklearn():
+    rng = np.random.default_rng(0)
+    y_true = pd.DataFrame({"Depression": rng.integers(0, 2, 500).astype(float)})
+    y_pred = rng.integers(0, 2, 500)
+
+    expected = [
+        accuracy_score(y_true, y_pred),
+        precision_score(y_true, y_pred),
+        recall_score(y_true, y_pred),
+        f1_score(y_true, y_pred),
+    ]
+    assert binary_classification_metrics(y_true, y_pred) == pytest.approx(expected)
+    assert binary_classification_metrics([0, 0], [0, 0]) == [1.0, 0.0, 0.0, 0.0]
+
+
+def test_evaluate_all_models_selects_best_f1(classification_data):
+    X, y = classification_data
+    models = {
+        "dummy": DummyClassifier(strategy="constant", constant=0).fit(X, y),
+        "decision_tree": DecisionTreeClassifier(random_state=0).fit(X, y),
+    }
+
+    y_pred, metrics, regressor, _, model_selection_name, _ = evaluate_all_models(
+        X, pd.DataFrame({"Depression": y}), {"evaluation_n_jobs": 2}, {}, **models
+    )
+
+    assert model_selection_name == {"model": "decision_tree"}
+    assert regressor is models["decision_tree"]
+    assert metrics["value_4"] == 1.0
+    assert (y_pred == y).all()
+
+
+def test_pipeline_evaluates_every_registered_model():
+    pipeline = create_pipeline()
+    evaluate = pipeline.filter(node_names=["evaluate_all_models"]).nodes[0]
+
+    for name in MODEL_REGISTRY:
+        assert f"regressor_{name}" in evaluate.inputs
+        assert pipeline.filter(node_names=[f"train_model_node_{name}"]).nodes
+
+
+def test_hyperparameter_search_is_bounded_by_successive_halving(classification_data):
+    X, y = classification_data
+    parameters = {
+        "enabled": True,
+        "n_candidates": 9,
+        "factor": 3,
+        "cv": 3,
+        "scoring": "f1",
+        "random_state": 0,
+        "spaces": {
+            "decision_tree": {
+                "max_depth": [2, 3, 5, 8, None],
+                "min_samples_leaf": [1, 5],
+            }
+        },
+    }
+
+    hyperparameters, trials = search_hyperparameters(
+        X, y, parameters, {}, model="decision_tree"
+    )
+
+    assert set(hyperparameters) == {"max_depth", "min_samples_leaf"}
+    # 9 candidates on 1/9 of the rows, 3 on 1/3 and the best one on all of them
+    assert trials.groupby("iter").size().tolist() == [9, 3, 1]
+    assert trials["n_resources"].max() > 0.9 * len(X)
+    assert search_hyperparameters(
+        X, y, dict(parameters, enabled=False), {}, model="decision_tree"
+    )[0] == {}
+
+
+def test_warm_start_continues_previous_models(splits):
+    parameters = {
+        "warm_start": {"enabled": True, "n_estimators": 5, "max_n_estimators": 15}
+    }
+
+    previous, _ = train_random_forest(*splits, {"n_estimators": 10}, None, parameters)
+    forest, _ = train_random_forest(*splits, {"n_estimators": 10}, previous, parameters)
+    assert len(forest.estimators_) == 15
+    np.testing.assert_array_equal(
+        forest.estimators_[0].tree_.threshold, previous.estimators_[0].tree_.threshold
+    )
+    # The previous version is left untouched
+    assert len(previous.estimators_) == previous.n_estimators == 10
+    # New hyperparameters train the forest from scratch
+    deeper, _ = train_random_forest(
+        *splits, {"n_estimators": 10, "max_depth": 3}, previous, parameters
+    )
+    assert len(deeper.estimators_) == 10
+    assert max(tree.get_depth() for tree in deeper.estimators_) <= 3
+    # Past max_n_estimators the forest is trained from scratch
+    forest, _ = train_random_forest(*splits, {"n_estimators": 10}, forest, parameters)
+    assert len(forest.estimators_) == 10
+
+    previous, _ = train_xg_boost(*splits, {"n_estimators": 10}, None, parameters)
+    booster, _ = train_xg_boost(*splits, {"n_estimators": 10}, previous, parameters)
+    assert booster.get_booster().num_boosted_rounds() == 15
+    assert previous.get_booster().num_boosted_rounds() == 10
+    booster, _ = train_xg_boost(*splits, {"n_estimators": 10}, booster, parameters)
+    assert booster.get_booster().num_boosted_rounds() == 10
+
+    cold, _ = train_logistic_regression(*splits, {}, None, parameters)
+    warm, _ = train_logistic_regression(*splits, {}, cold, parameters)
+    assert warm.n_iter_[0] <= cold.n_iter_[0]
+
+    parameters["warm_start"]["enabled"] = False
+    forest, _ = train_random_forest(*splits, {"n_estimators": 5}, forest, parameters)
+    assert len(forest.estimators_) == 5
+
+
+def test_cross_validation_selects_on_mean_fold_scores(classification_data):
+    X, y = classification_data
+    parameters = {
+        "cross_validation": {
+            "enabled": True,
+            "n_splits": 3,
+            "n_jobs": 2,
+            "random_state": 0,
+        }
+    }
+    hyperparameters = {"decision_tree": {"max_depth": 1}, "random_forest": {}}
+
+    cv_scores = cross_validate_models(X, y, parameters, **hyperparameters)
+
+    folds = StratifiedKFold(3, shuffle=True, random_state=0)
+    expected = cross_val_score(
+        make_estimator("decision_tree", max_depth=1), X, y, cv=folds, scoring="f1"
+    )
+    assert cv_scores["decision_tree"]["mean"][3] == pytest.approx(expected.mean())
+    assert cv_scores["decision_tree"]["std"][3] == pytest.approx(expected.std())
+
+    models = {
+        name: make_estimator(name, **hp).fit(X, y)
+        for name, hp in hyperparameters.items()
+    }
+    _, metrics, _, _, model_selection_name, _ = evaluate_all_models(
+        X, y.to_frame(), parameters, cv_scores, **models
+    )
+    assert model_selection_name == {"model": "random_forest"}
+    assert metrics["value_4"] == cv_scores["random_forest"]["mean"][3]
+    assert "value_4_std" in metrics
+    assert cross_validate_models(X, y, {}, **hyperparameters) == {}
+
+
+def test_training_on_memory_mapped_float32_arrays(classification_data, tmp_path):
+    X, y = classification_data
+    data = X.assign(Depression=y)
+    parameters = {
+        "features": X.columns.tolist(),
+        "test_size": 0.2,
+        "calibration_size": 0.2,
+        "random_state": 3,
+    }
+    X_train, X_test, y_train, y_test, X_calib, y_calib, X_train_array = split_data(
+        data, parameters
+    )
+
+    arrays = {}
+    for name, array in [
+        ("X_train_array", X_train_array),
+        ("y_train", y_train),
+        ("X_calib", X_calib),
+        ("y_calib", y_calib),
+    ]:
+        dataset = NumpyDataset(str(tmp_path / f"{name}.npy"), {"mmap_mode": "r"})
+        dataset.save(array)
+        arrays[name] = dataset.load()
+
+    # The features are DataFrames over the memory-mapped float32 arrays
+    features = arrays["X_train_array"]
+    assert features.columns.tolist() == X.columns.tolist()
+    assert (features.dtypes == np.float32).all()
+    memmap = np.load(tmp_path / "X_train_array.npy", mmap_mode="r")
+    assert np.shares_memory(features.to_numpy(), arrays["X_train_array"].to_numpy())
+    np.testing.assert_allclose(features, X_train, rtol=1e-6)
+    np.testing.assert_array_equal(memmap, features.to_numpy())
+    assert arrays["y_train"].dtype == y.dtype
+
+    for model in MODEL_REGISTRY.values():
+        previous = [None] if model.warm_start else []
+        regressor, _ = model.train(*arrays.values(), {}, *previous, {})
+        assert regressor.feature_names_in_.tolist() == X.columns.tolist()
+        assert regressor.classes_.dtype == y.dtype
+        (score, *_), y_pred, _ = evaluate_model(regressor, X_test, y_test)
+        assert y_pred.dtype == y.dtype
+        assert score > 0.5
+
+
+def test_fast_profile_and_training_times(classification_data, splits):
+    X, y = classification_data
+    parameters = {
+        "profile": "fast",
+        "profiles": {"fast": {"xg_boost": {"tree_method": "hist", "max_bin": 64}}},
+    }
+
+    xg_boost, _ = train_xg_boost(*splits, {}, None, parameters)
+    hist_gradient_boosting, _ = train_hist_gradient_boosting(*splits, {}, parameters)
+    assert xg_boost.get_params()["max_bin"] == 64
+
+    *_, model_scores = evaluate_all_models(
+        X,
+        y.to_frame(),
+        {},
+        {},
+        xg_boost=xg_boost,
+        hist_gradient_boosting=hist_gradient_boosting,
+    )
+    assert model_scores["model"].tolist() == ["xg_boost", "hist_gradient_boosting"]
+    assert (model_scores["training_time"] > 0).all()
+
+
+def test_latency_budget_rejects_slow_models(classification_data):
+    class SlowClassifier(DecisionTreeClassifier):
+        def predict(self, X):
+            time.sleep(0.05)
+            return super().predict(X)
+
+    X, y = classification_data
+    y_test = y.to_frame("Depression")
+    models = {
+        "slow": SlowClassifier(random_state=0).fit(X, y),
+        "fast": DecisionTreeClassifier(max_depth=1, random_state=0).fit(X, y),
+    }
+
+    _, _, timings = evaluate_model(models["slow"], X, y_test, latency_samples=20)
+    assert timings["latency_p50_ms"] >= 50
+    assert timings["latency_p99_ms"] >= timings["latency_p50_ms"]
+    assert timings["throughput"] > 0
+
+    parameters = {"selection": {"latency_samples": 20}}
+    model_selection_name = evaluate_all_models(X, y_test, parameters, {}, **models)[4]
+    assert model_selection_name == {"model": "slow"}
+
+    parameters["selection"]["latency_budget_ms"] = 25
+    _, metrics, _, _, model_selection_name, model_scores = evaluate_all_models(
+        X, y_test, parameters, {}, **models
+    )
+    assert model_selection_name == {"model": "fast"}
+    assert metrics["latency_p99_ms"] <= 25
+    assert set(model_scores.columns) >= {"f1", "latency_p50_ms", "throughput"}
+
+    parameters["selection"]["latency_budget_ms"] = 0
+    with pytest.raises(ValueError, match="latency budget"):
+        evaluate_all_models(X, y_test, parameters, {}, **models)
+
+
+def test_drift_checks_return_the_report_without_serializing_it(survey_features, mocker):
+    X = survey_features
+    rng = np.random.default_rng(1)
+    y_test = pd.DataFrame({"Depression": rng.integers(0, 2, 300).astype(float)})
+    X_train_sketch, y_test_sketch = sketch_reference_data(X.iloc[:300], y_test)
+    parameters = {"drift_share": 0.5, "stattest_threshold": None}
+    dumps = mocker.spy(json, "dumps")
+    loads = mocker.spy(json, "loads")
+
+    data_drift = quality_drift_check(X_train_sketch, X.iloc[300:], parameters)
+    pred_drift = prediction_drift_check(
+        pd.DataFrame({"Depression": rng.integers(0, 2, 300)}), y_test_sketch, parameters
+    )
+
+    assert dumps.call_count == loads.call_count == 0
+    for report in (data_drift, pred_drift):
+        assert json.loads(json.dumps(report)) == report
+    drift_by_columns = data_drift["metrics"][1]["result"]["drift_by_columns"]
+    assert set(drift_by_columns) == {"Age", "Degree"}
+
+    with pytest.raises(Exception, match="Prediction Variable Drift"):
+        prediction_drift_check(
+            pd.DataFrame({"Depression": np.ones(300)}), y_test_sketch, parameters
+        )
+
+
+def test_html_drift_report_is_the_only_reader_of_the_training_data(
+    survey_features, mocker, tmp_path, monkeypatch
+):
+    X = survey_features
+    X_train_sketch, _ = sketch_reference_data(X.iloc[:300], X[["Degree"]])
+    load_X_train = mocker.Mock(return_value=X.iloc[:300])
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data" / "08_reporting").mkdir(parents=True)
+
+    parameters = {"drift_share": 0.5, "stattest_threshold": None, "html_report": False}
+    data_drift = quality_drift_check(
+        X_train_sketch, X.iloc[300:], parameters, load_X_train
+    )
+    load_X_train.assert_not_called()
+    assert not (tmp_path / "data" / "08_reporting" / "data_drift.html").exists()
+
+    parameters["html_report"] = True
+    assert (
+        quality_drift_check(X_train_sketch, X.iloc[300:], parameters, load_X_train)
+        == data_drift
+    )
+    load_X_train.assert_called_once()
+    assert (tmp_path / "data" / "08_reporting" / "data_drift.html").exists()
+
+
+def test_report_plotly_builds_one_dashboard_and_batches_the_pngs(mocker, tmp_path):
+    def report(columns):
+        distribution = {"x": [0.0, 0.5, 1.0], "y": [0.4, 1.6]}
+        return {
+            "metrics": [
+                {},
+                {
+                    "result": {
+                        "drift_by_columns": {
+                            column: {
+                                "current": {"small_distribution": distribution},
+                                "reference": {"small_distribution": distribution},
+                            }
+                            for column in columns
+                        }
+                    }
+                },
+            ]
+        }
+
+    data_drift = report(["Age", "Work/Study Hours", "CGPA", "Degree"])
+    pred_drift = report(["Depression"])
+    write_image = mocker.patch.object(data_science_nodes.pio, "write_image")
+
+    dashboard, _ = report_plotly(data_drift, pred_drift, {"png": False})
+    write_image.assert_not_called()
+    assert len(dashboard.data) == 2 * 5
+    assert [a.text for a in dashboard.layout.annotations][-1] == "Depression"
+    HTMLDataset(filepath=str(tmp_path / "dashboard.html")).save(dashboard)
+    assert (tmp_path / "dashboard.html").stat().st_size > 0
+
+    report_plotly(data_drift, pred_drift, {"png": True, "n_jobs": 1})
+    assert sorted(call.kwargs["file"] for call in write_image.call_args_list) == sorted(
+        f"data/08_reporting/{c}_distribution.png"
+        for c in ["Age", "Work_Study Hours", "CGPA", "Degree", "Depression"]
+    )
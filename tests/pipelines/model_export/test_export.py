@@ -0,0 +1,81 @@
+import numpy as np
+import onnxruntime as ort
+import pandas as pd
+import pytest
+from kedro_datasets.partitions import PartitionedDataset
+from sklearn.datasets import make_classification
+from sklearn.tree import DecisionTreeClassifier
+
+from rohith_ai_839.pipelines.data_science.nodes import make_estimator
+from rohith_ai_839.pipelines.model_export.nodes import export_onnx
+
+PARAMETERS = {
+    "opset": 15,
+    "ml_opset": 3,
+    "min_label_agreement": 0.999,
+    "probability_atol": 1.0e-4,
+    "latency_samples": 20,
+}
+
+
+@pytest.fixture
+def train_test():
+    X, y = make_classification(n_samples=300, n_features=5, random_state=0)
+    X = pd.DataFrame(X, columns=[f"X_{i}" for i in range(5)]).astype(np.float32)
+    return X[:200], y[:200], X[200:]
+
+
+@pytest.mark.parametrize(
+    "model", ["logistic_regression", "random_forest", "xg_boost", "decision_tree"]
+)
+def test_selected_model_is_exported_with_parity(train_test, model):
+    X_train, y_train, X_test = train_test
+    regressor = make_estimator(model).fit(X_train, y_train)
+
+    onnx_models, parity = export_onnx(regressor, {"model": model}, X_test, PARAMETERS)
+
+    assert list(onnx_models) == [model]
+    assert parity["exported"] == 1.0
+    assert parity["label_agreement"] >= PARAMETERS["min_label_agreement"]
+
+    session = ort.InferenceSession(onnx_models[model].SerializeToString())
+    labels, _ = session.run(None, {"input": X_test.to_numpy()})
+    np.testing.assert_array_equal(labels, regressor.predict(X_test))
+
+
+def test_unsupported_model_is_not_exported(train_test):
+    class CustomTree(DecisionTreeClassifier):
+        pass
+
+    X_train, y_train, X_test = train_test
+    regressor = CustomTree().fit(X_train, y_train)
+
+    onnx_models, parity = export_onnx(
+        regressor, {"model": "custom"}, X_test, PARAMETERS
+    )
+
+    assert onnx_models == {}
+    assert parity["exported"] == 0.0
+
+
+def test_onnx_models_round_trip_through_the_catalog(train_test, tmp_path):
+    X_train, y_train, X_test = train_test
+    regressor = make_estimator("decision_tree").fit(X_train, y_train)
+    onnx_models, _ = export_onnx(
+        regressor, {"model": "decision_tree"}, X_test, PARAMETERS
+    )
+
+    dataset = PartitionedDataset(
+        path=str(tmp_path),
+        dataset="rohith_ai_839.datasets.ONNXModelDataset",
+        filename_suffix=".onnx",
+        overwrite=True,
+    )
+    dataset.save(onnx_models)
+    loaded = dataset.load()["decision_tree"]()
+    expected = onnx_models["decision_tree"]
+    assert loaded.SerializeToString() == expected.SerializeToString()
+
+    # A model that is not exported leaves no stale file behind
+    dataset.save({})
+    assert not (tmp_path / "decision_tree.onnx").exists()
@@ -0,0 +1,181 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from rohith_ai_839.drift import OnlineDriftMonitor, drift_report, reference_sketch
+
+
+def make_frames(n_rows, shift=0.0, seed=0):
+    rng = np.random.default_rng(seed)
+    reference = pd.DataFrame(
+        {
+            "Age": rng.normal(40, 10, n_rows),
+            "Financial Stress": rng.integers(1, 6, n_rows),
+            "City": rng.choice(["Pune", "Delhi", "Surat"], n_rows),
+        }
+    )
+    current = pd.DataFrame(
+        {
+            "Age": rng.normal(40 + shift, 10, n_rows),
+            "Financial Stress": rng.integers(1, 6, n_rows),
+            "City": rng.choice(["Pune", "Delhi", "Surat"], n_rows),
+        }
+    )
+    current.loc[:9, "Age"] = np.nan
+    return reference, current
+
+
+@pytest.mark.parametrize("n_rows", [500, 3000])
+def test_drift_scores_match_scipy(n_rows):
+    reference, current = make_frames(n_rows, shift=3.0)
+    drift_by_columns = drift_report(reference, current)["metrics"][1]["result"][
+        "drift_by_columns"
+    ]
+
+    age = drift_by_columns["Age"]
+    if n_rows > 1000:
+        expected = stats.wasserstein_distance(
+            reference["Age"], current["Age"].dropna()
+        ) / np.std(reference["Age"])
+        assert age["stattest_name"] == "Wasserstein distance (normed)"
+        # Computed from the 1000 quantiles of the reference sketch
+        tolerance = 1e-3
+    else:
+        expected = stats.ks_2samp(
+            reference["Age"], current["Age"].dropna(), method="asymp"
+        ).pvalue
+        assert age["stattest_name"] == "K-S p_value"
+        tolerance = 1e-6
+    assert age["drift_score"] == pytest.approx(expected, rel=tolerance)
+    assert age["drift_detected"]
+
+    # Low cardinality numerical and string columns are tested as categories
+    counts = pd.crosstab(
+        np.r_[np.zeros(n_rows), np.ones(n_rows)],
+        pd.concat([reference["City"], current["City"]]).to_numpy(),
+    ).to_numpy()
+    city = drift_by_columns["City"]
+    if n_rows > 1000:
+        share = counts / counts.sum(axis=1, keepdims=True)
+        expected = ((share[0] - share[1]) * np.log(share[0] / share[1])).sum()
+    else:
+        expected = stats.chisquare(
+            counts[1], counts[0] / counts[0].sum() * counts[1].sum()
+        ).pvalue
+    assert city["drift_score"] == pytest.approx(expected, rel=1e-6)
+    assert city["reference"]["small_distribution"] == {
+        "x": ["Delhi", "Pune", "Surat"],
+        "y": counts[0].tolist(),
+    }
+    assert drift_by_columns["Financial Stress"]["stattest_name"] in {
+        "chi-square p_value",
+        "PSI",
+    }
+
+
+def test_drift_report_has_the_evidently_structure():
+    reference, current = make_frames(500)
+    report = json.loads(json.dumps(drift_report(reference, current)))
+
+    dataset_drift = report["metrics"][0]["result"]
+    assert dataset_drift["number_of_columns"] == 3
+    assert dataset_drift["dataset_drift"] is False
+
+    age = report["metrics"][1]["result"]["drift_by_columns"]["Age"]
+    assert age["column_type"] == "num"
+    distribution = age["current"]["small_distribution"]
+    densities, edges = np.histogram(current["Age"].dropna(), bins=10, density=True)
+    np.testing.assert_allclose(distribution["x"], edges)
+    np.testing.assert_allclose(distribution["y"], densities)
+
+
+@pytest.mark.parametrize("n_rows", [500, 3000])
+def test_drift_is_tested_against_the_reference_sketch(n_rows):
+    reference, current = make_frames(n_rows, shift=1.0)
+    current.loc[:4, "City"] = "Mumbai"
+    sketch = json.loads(json.dumps(reference_sketch(reference)))
+    drift_by_columns = drift_report(sketch, current)["metrics"][1]["result"][
+        "drift_by_columns"
+    ]
+
+    assert len(sketch["columns"]["Age"]["quantiles"]) <= 1000
+    age = drift_by_columns["Age"]
+    if n_rows > 1000:
+        expected = stats.wasserstein_distance(
+            reference["Age"], current["Age"].dropna()
+        ) / np.std(reference["Age"])
+        # Within a fraction of a percent with the 1000 quantiles of the sketch
+        tolerance = 5e-3
+    else:
+        # The sketch keeps every value, the test is exact
+        expected = stats.ks_2samp(
+            reference["Age"], current["Age"].dropna(), method="asymp"
+        ).pvalue
+        tolerance = 1e-6
+    assert age["drift_score"] == pytest.approx(expected, rel=tolerance)
+
+    # Categories missing from the reference data are appended to the sketch ones
+    counts = (
+        pd.crosstab(
+            np.r_[np.zeros(n_rows), np.ones(n_rows)],
+            pd.concat([reference["City"], current["City"]]).to_numpy(),
+        )
+        .reindex(columns=["Delhi", "Pune", "Surat", "Mumbai"])
+        .to_numpy()
+    )
+    city = drift_by_columns["City"]
+    assert city["current"]["small_distribution"] == {
+        "x": ["Delhi", "Pune", "Surat", "Mumbai"],
+        "y": counts[1].tolist(),
+    }
+    if n_rows > 1000:
+        share = np.maximum(counts / counts.sum(axis=1, keepdims=True), 0.0001)
+        expected = ((share[0] - share[1]) * np.log(share[0] / share[1])).sum()
+        assert city["drift_score"] == pytest.approx(expected, rel=1e-6)
+    else:
+        # The expected count of Mumbai is 0, the chi-square statistic is infinite
+        assert city["drift_score"] == 0.0
+        assert city["drift_detected"]
+
+
+@pytest.fixture
+def reference():
+    reference, _ = make_frames(3000)
+    return reference
+
+
+def test_online_monitor_tracks_drift_over_a_sliding_window(reference):
+    drifted, _ = make_frames(3000, seed=1)
+    drifted["Age"] += 15
+    drifted["City"] = "Mumbai"
+    monitor = OnlineDriftMonitor(
+        reference_sketch(reference), window_size=200, min_samples=50
+    )
+
+    for record in reference.iloc[:300].to_dict("records"):
+        monitor.update(record)
+    report = monitor.report()
+    assert report["window"] == 200
+    assert not report["dataset_drift"]
+
+    for record in drifted.iloc[:200].to_dict("records"):
+        monitor.update(record)
+    report = monitor.report()
+    assert report["drift_by_columns"]["Age"]["drift_detected"]
+    assert report["drift_by_columns"]["City"]["drift_detected"]
+    assert not report["drift_by_columns"]["Financial Stress"]["drift_detected"]
+    # The reference records were all evicted from the window
+    assert report["window"] == 200
+    assert {c: r["count"] for c, r in report["drift_by_columns"].items()} == {
+        "Age": 200,
+        "Financial Stress": 200,
+        "City": 200,
+    }
+
+    # Records that did not drift push the drifted ones out of the window
+    for record in reference.iloc[300:500].to_dict("records"):
+        monitor.update(record)
+    assert not monitor.report()["dataset_drift"]
@@ -0,0 +1,137 @@
+import logging
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from kedro.config import OmegaConfigLoader
+from kedro.io import DataCatalog, MemoryDataset, Version
+from kedro.pipeline import node, pipeline
+from kedro_datasets.json import JSONDataset
+from kedro_datasets.pandas import CSVDataset
+
+from benchmarks.data_processing import make_survey_frame
+from rohith_ai_839.pipelines.data_processing import create_pipeline
+from rohith_ai_839.runner import CachingSequentialRunner
+
+CALLS = []
+
+
+def double(dataset):
+    CALLS.append(len(dataset))
+    return dataset * 2
+
+
+def test_caching_runner_skips_unchanged_nodes(tmp_path):
+    catalog = DataCatalog(
+        {
+            "raw": CSVDataset(filepath=str(tmp_path / "raw.csv")),
+            "doubled": CSVDataset(filepath=str(tmp_path / "doubled.csv")),
+            "node_fingerprints": JSONDataset(
+                filepath=str(tmp_path / "fingerprints.json")
+            ),
+        }
+    )
+    catalog.save("raw", pd.DataFrame({"a": [1, 2, 3]}))
+    double_pipeline = pipeline(
+        [node(double, "raw", "doubled", name="double_node", tags=["cacheable"])]
+    )
+    CALLS.clear()
+
+    CachingSequentialRunner().run(double_pipeline, catalog)
+    CachingSequentialRunner().run(double_pipeline, catalog)
+    assert len(CALLS) == 1
+
+    catalog.save("raw", pd.DataFrame({"a": [4, 5, 6]}))
+    CachingSequentialRunner().run(double_pipeline, catalog)
+    assert len(CALLS) == 2
+    assert catalog.load("doubled")["a"].tolist() == [8, 10, 12]
+
+
+def test_caching_runner_hashes_the_latest_version_of_versioned_inputs(tmp_path):
+    catalog = DataCatalog(
+        {
+            "raw": CSVDataset(
+                filepath=str(tmp_path / "raw.csv"), version=Version(None, None)
+            ),
+            "doubled": CSVDataset(filepath=str(tmp_path / "doubled.csv")),
+            "node_fingerprints": JSONDataset(
+                filepath=str(tmp_path / "fingerprints.json")
+            ),
+        }
+    )
+    catalog.save("raw", pd.DataFrame({"a": [1, 2, 3]}))
+    double_pipeline = pipeline(
+        [node(double, "raw", "doubled", name="double_node", tags=["cacheable"])]
+    )
+    CALLS.clear()
+
+    CachingSequentialRunner().run(double_pipeline, catalog)
+    CachingSequentialRunner().run(double_pipeline, catalog)
+    assert len(CALLS) == 1
+
+    # A new version is saved next to the first one
+    time.sleep(0.01)
+    catalog.save("raw", pd.DataFrame({"a": [4, 5, 6]}))
+    CachingSequentialRunner().run(double_pipeline, catalog)
+    assert len(CALLS) == 2
+
+
+def test_caching_runner_never_skips_nodes_with_unhashable_inputs(tmp_path):
+    catalog = DataCatalog(
+        {
+            "raw": MemoryDataset(pd.DataFrame({"a": [1, 2, 3]})),
+            "doubled": CSVDataset(filepath=str(tmp_path / "doubled.csv")),
+            "node_fingerprints": JSONDataset(
+                filepath=str(tmp_path / "fingerprints.json")
+            ),
+        }
+    )
+    double_pipeline = pipeline(
+        [node(double, "raw", "doubled", name="double_node", tags=["cacheable"])]
+    )
+    CALLS.clear()
+
+    CachingSequentialRunner().run(double_pipeline, catalog)
+    CachingSequentialRunner().run(double_pipeline, catalog)
+    assert len(CALLS) == 2
+    assert "double_node" not in catalog.load("node_fingerprints")
+
+
+def test_caching_runner_skips_the_unchanged_data_processing_pipeline(tmp_path, caplog):
+    config = OmegaConfigLoader(conf_source="conf", default_run_env="base")
+    data_processing = create_pipeline()
+    # The project catalog, with every file moved to tmp_path
+    names = data_processing.datasets() | {"node_fingerprints"}
+    catalog = DataCatalog.from_config(
+        {
+            name: {**entry, "filepath": str(tmp_path / Path(entry["filepath"]).name)}
+            for name, entry in config["catalog"].items()
+            if name in names
+        }
+    )
+    catalog.add_feed_dict(
+        {
+            "params:preprocessing_options": config["parameters"][
+                "preprocessing_options"
+            ]
+        }
+    )
+    make_survey_frame(500).to_csv(tmp_path / "depression_synthetic.csv", index=False)
+    survey_inputs_log = make_survey_frame(100, seed=1)
+    survey_inputs_log["Depression"] = np.nan
+    catalog.save("survey_inputs_log", survey_inputs_log)
+
+    CachingSequentialRunner().run(data_processing, catalog)
+    assert set(catalog.load("node_fingerprints")) == {
+        "preprocess_dataset_node",
+        "preprocess_user_predictions_log_node",
+    }
+
+    with caplog.at_level(logging.INFO, logger="rohith_ai_839.runner"):
+        CachingSequentialRunner().run(data_processing, catalog)
+    skipped = [r.args[0] for r in caplog.records if r.msg.startswith("Skipping")]
+    assert skipped == [
+        "preprocess_dataset_node",
+        "preprocess_user_predictions_log_node",
+    ]
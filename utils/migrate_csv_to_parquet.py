@@ -0,0 +1,57 @@
+"""
+Converts the CSV datasets written before the catalog switched to Parquet.
+
+Every version of a versioned dataset is converted under the same version name, so
+`kedro run --load-versions` keeps working for runs made with the CSV catalog. Run it
+from the project root:
+
+    python utils/migrate_csv_to_parquet.py
+"""
+from pathlib import Path
+
+import pandas as pd
+
+# CSV file path -> Parquet file path, as declared in conf/base/catalog.yml
+VERSIONED_DATASETS = {
+    # The CSV model input was declared with the directory as its filepath, so its
+    # versions are data/05_model_input/<version>/05_model_input
+    "data/05_model_input/": "data/05_model_input/model_input_dataset.parquet",
+    "data/05_model_input/X_train.csv": "data/05_model_input/X_train.parquet",
+    "data/05_model_input/X_test.csv": "data/05_model_input/X_test.parquet",
+    "data/05_model_input/y_test.csv": "data/05_model_input/y_test.parquet",
+}
+DATASETS = {
+    "data/05_model_input/user_accounts_predictions_log.csv": (
+        "data/05_model_input/user_accounts_predictions_log.parquet"
+    ),
+}
+
+
+def convert(csv_path, parquet_path):
+    if parquet_path.exists():
+        print(f"Skipping {csv_path}, {parquet_path} already exists")
+        return
+    parquet_path.parent.mkdir(parents=True, exist_ok=True)
+    pd.read_csv(csv_path).to_parquet(parquet_path, index=False)
+    print(f"Converted {csv_path} to {parquet_path}")
+
+
+def migrate_versioned(csv_filepath, parquet_filepath):
+    # Versioned datasets are stored as <filepath>/<version>/<filename>
+    for version_dir in sorted(Path(csv_filepath).iterdir()):
+        csv_path = version_dir / Path(csv_filepath).name
+        if csv_path.is_file():
+            parquet_path = (
+                Path(parquet_filepath) / version_dir.name / Path(parquet_filepath).name
+            )
+            convert(csv_path, parquet_path)
+
+
+if __name__ == "__main__":
+    for csv_filepath, parquet_filepath in VERSIONED_DATASETS.items():
+        if Path(csv_filepath).is_dir():
+            migrate_versioned(csv_filepath, parquet_filepath)
+
+    for csv_filepath, parquet_filepath in DATASETS.items():
+        if Path(csv_filepath).is_file():
+            convert(Path(csv_filepath), Path(parquet_filepath))